@@ -6,7 +6,6 @@ Main FastAPI application setup and configuration.
 
 import os
 import logging
-import uuid
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
@@ -14,10 +13,12 @@ from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from pydantic import BaseModel, ValidationError
 
+from .responses import ORJSONResponse
 from .routes import discovery, scenarios, optimization, creative, data, auth, postmortem
 from middleware.errors import (
     APIError,
     api_error_handler,
+    generate_request_id,
     http_exception_handler,
     validation_exception_handler,
     general_exception_handler
@@ -47,6 +48,7 @@ app = FastAPI(
     title="Promo Scenario Co-Pilot API",
     description="AI-powered promotional campaign planning and optimization system",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Add rate limiter to app
@@ -103,8 +105,8 @@ async def request_middleware(request: Request, call_next):
     """Add request ID and log requests for observability."""
     import time
     
-    # Generate request ID
-    request_id = str(uuid.uuid4())
+    # Reuse the active trace id when tracing is on; random hex otherwise
+    request_id = generate_request_id()
     request.state.request_id = request_id
     
     start_time = time.time()
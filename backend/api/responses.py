@@ -0,0 +1,41 @@
+"""
+Response Helpers
+
+orjson-backed JSON rendering for API routes.
+
+Response-heavy endpoints return ORJSONResponse directly with pre-dumped
+content, skipping FastAPI's jsonable_encoder pass entirely.
+"""
+
+from typing import Any
+
+import orjson
+from pydantic import BaseModel
+from starlette.responses import JSONResponse, Response
+
+# Non-str keys cover Dict[date, ...] payloads (daily_projections, timeline);
+# numpy covers scalars coming straight out of pandas aggregations.
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=_ORJSON_OPTIONS)
+
+
+def pydantic_response(model: BaseModel) -> Response:
+    """
+    Serialize a Pydantic model straight through pydantic-core's Rust
+    serializer (model_dump_json), skipping the intermediate Python dict.
+
+    exclude_none drops the many rarely-populated Optional fields in
+    schemas.py from the payload.
+    """
+    return Response(
+        content=model.model_dump_json(exclude_none=True),
+        media_type="application/json",
+    )
@@ -9,10 +9,9 @@ from pydantic import BaseModel
 from typing import Optional
 from datetime import datetime, timedelta
 import secrets
-import hashlib
 from sqlalchemy.orm import Session
 
-from middleware.auth import create_access_token, get_current_user, User, Role, require_admin
+from middleware.auth import create_access_token, get_current_user, hash_api_key, User, Role, require_admin
 from db.session import get_session
 from db.base import ApiKey
 
@@ -49,7 +48,7 @@ async def create_api_key(
     expires_at = datetime.utcnow() + timedelta(days=request.expires_in_days)
     
     # Persist hashed key
-    key_hash = hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+    key_hash = hash_api_key(api_key)
     db.add(ApiKey(name=request.name, key_hash=key_hash, expires_at=expires_at, created_by=current_user.email))
     db.commit()
 
@@ -4,12 +4,15 @@ Creative API Routes
 Endpoints for creative brief and asset generation.
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
 from typing import List, Optional
 from datetime import date, timedelta
 import json
 from sqlalchemy.orm import Session
 
+from ..responses import pydantic_response
 from models.schemas import PromoScenario, CampaignPlan, CreativeBrief, AssetSpec
 from engines.creative_engine import CreativeEngine
 from tools.targets_config_tool import TargetsConfigTool
@@ -25,20 +28,25 @@ config_tool = TargetsConfigTool()
 cdp_tool = CDPTool()
 creative_engine = CreativeEngine(cdp_tool=cdp_tool, config_tool=config_tool)
 
+# Built once at import; avoids FastAPI's per-request adapter assembly
+_SCENARIO_LIST_ADAPTER = TypeAdapter(List[PromoScenario])
 
-@router.post("/finalize")
-async def finalize_campaign(
-    scenarios: List[PromoScenario]
-) -> CampaignPlan:
+
+@router.post("/finalize", response_model=None)
+async def finalize_campaign(request: Request) -> CampaignPlan:
     """
     Finalize selected scenarios into campaign plan.
     
     Args:
-        scenarios: List of selected PromoScenario objects
+        request: Body is a JSON list of selected PromoScenario objects
     
     Returns:
         CampaignPlan object
     """
+    try:
+        scenarios = _SCENARIO_LIST_ADAPTER.validate_json(await request.body())
+    except ValidationError as exc:
+        raise RequestValidationError(exc.errors()) from exc
     if not scenarios:
         raise HTTPException(status_code=400, detail="At least one scenario is required")
     
@@ -75,11 +83,11 @@ async def finalize_campaign(
             }
         }
         
-        return CampaignPlan(
+        return pydantic_response(CampaignPlan(
             scenarios=scenarios,
             timeline=timeline,
             execution_details=execution_details
-        )
+        ))
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(status_code=500, detail=f"Error finalizing campaign: {str(exc)}") from exc
 
@@ -6,10 +6,13 @@ Endpoints for data processing and ETL operations.
 
 import os
 import tempfile
-from fastapi import APIRouter, HTTPException, UploadFile, File, Request, Depends
+from fastapi import APIRouter, HTTPException, UploadFile, File, Request, Depends, Response
 from typing import List
 from datetime import date
 
+import orjson
+import pandas as pd
+
 from middleware.rate_limit import get_rate_limit
 from middleware.auth import get_current_user, require_promo_lead
 from middleware.errors import ProcessingError, ValidationError
@@ -201,7 +204,7 @@ async def get_quality_report(
         raise HTTPException(status_code=500, detail=f"Error generating quality report: {str(exc)}") from exc
 
 
-@router.get("/baseline")
+@router.get("/baseline", response_model=None)
 async def get_baseline(
     start_date: date,
     end_date: date,
@@ -219,18 +222,26 @@ async def get_baseline(
                 filters=df_filters
             )
             if not agg.empty:
-                baseline.total_sales = float(agg["sales_value"].sum())
-                baseline.total_margin = float(agg["margin_value"].sum())
-                baseline.total_units = float(agg["units"].sum())
+                # Rebuild the per-day arrays from the filtered aggregate;
+                # totals are computed fields, so they follow automatically
+                baseline = BaselineForecast(
+                    date_range=baseline.date_range,
+                    dates=pd.to_datetime(agg["date"]).dt.date.tolist(),
+                    sales=agg["sales_value"].astype(float).tolist(),
+                    margin=agg["margin_value"].astype(float).tolist(),
+                    units=agg["units"].astype(float).tolist(),
+                    gap_vs_target=baseline.gap_vs_target,
+                )
         return baseline
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
-@router.get("/segments")
-async def get_segments() -> dict:
-    """Return demo CDP segments."""
-    segments = [
+# Static reference payloads, serialized once at import; the routes below
+# serve the pre-encoded bytes directly (a straight copy, no per-request
+# encoding)
+_SEGMENTS_JSON: bytes = orjson.dumps({
+    "segments": [
         {
             "segment_id": "LOYAL_HIGH_VALUE",
             "name": "Loyal High Value",
@@ -250,7 +261,13 @@ async def get_segments() -> dict:
             "description": "Acquired in last 90 days",
         },
     ]
-    return {"segments": segments}
+})
+
+
+@router.get("/segments")
+async def get_segments() -> Response:
+    """Return demo CDP segments."""
+    return Response(content=_SEGMENTS_JSON, media_type="application/json")
 
 
 @router.get("/uplift-model")
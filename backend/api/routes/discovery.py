@@ -4,12 +4,13 @@ Discovery API Routes
 Endpoints for discovery and context analysis.
 """
 
-from fastapi import APIRouter, HTTPException, Body
+from fastapi import APIRouter, HTTPException, Body, Response
 from typing import List, Optional, Dict, Any
 from datetime import date
 from calendar import monthrange
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
+from ..responses import ORJSONResponse
 from models.schemas import PromoOpportunity, PromoContext, GapAnalysis, DateRange
 from engines.forecast_baseline_engine import ForecastBaselineEngine
 from tools.sales_data_tool import SalesDataTool
@@ -23,6 +24,9 @@ context_tool = ContextDataTool()
 targets_tool = TargetsConfigTool()
 baseline_engine = ForecastBaselineEngine(sales_data_tool=sales_tool, targets_tool=targets_tool)
 
+# Built once at import; dump_json drives pydantic-core's serializer directly
+_OPP_LIST_ADAPTER = TypeAdapter(List[PromoOpportunity])
+
 
 class DiscoveryAnalyzeRequest(BaseModel):
     month: str
@@ -55,23 +59,12 @@ def _build_context(geo: str, start_date: date, end_date: date) -> PromoContext:
     )
 
 
-@router.get("/opportunities")
-async def get_opportunities(
+def _find_opportunities(
     month: str,
     geo: str,
     targets: Optional[dict] = None
 ) -> List[PromoOpportunity]:
-    """
-    Analyze situation and identify promotional opportunities.
-    
-    Args:
-        month: Target month (e.g., "2024-10")
-        geo: Geographic region
-        targets: Optional targets dictionary
-    
-    Returns:
-        List of promotional opportunities
-    """
+    """Identify promotional opportunities for a month (shared by routes)."""
     start_date, end_date = _month_to_range(month)
     try:
         baseline = baseline_engine.calculate_baseline((start_date, end_date))
@@ -102,7 +95,32 @@ async def get_opportunities(
     return opportunities
 
 
-@router.get("/context")
+@router.get("/opportunities", response_model=None)
+async def get_opportunities(
+    month: str,
+    geo: str,
+    targets: Optional[dict] = None
+) -> List[PromoOpportunity]:
+    """
+    Analyze situation and identify promotional opportunities.
+
+    Args:
+        month: Target month (e.g., "2024-10")
+        geo: Geographic region
+        targets: Optional targets dictionary
+
+    Returns:
+        List of promotional opportunities
+    """
+    opportunities = _find_opportunities(month, geo, targets)
+    # One adapter dump straight to bytes, skipping per-model dict round-trips
+    return Response(
+        content=_OPP_LIST_ADAPTER.dump_json(opportunities, exclude_none=True),
+        media_type="application/json",
+    )
+
+
+@router.get("/context", response_model=None)
 async def get_context(
     geo: str,
     start_date: date,
@@ -131,7 +149,7 @@ async def get_context(
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
-@router.get("/gaps")
+@router.get("/gaps", response_model=None)
 async def get_gaps(
     month: str,
     geo: str,
@@ -167,7 +185,7 @@ async def get_gaps(
     )
 
 
-@router.post("/analyze")
+@router.post("/analyze", response_model=None)
 async def analyze(payload: DiscoveryAnalyzeRequest = Body(...)) -> dict:
     """Analyze situation and identify opportunities with baseline and gaps."""
     month = payload.month
@@ -178,8 +196,8 @@ async def analyze(payload: DiscoveryAnalyzeRequest = Body(...)) -> dict:
     baseline = baseline_engine.calculate_baseline((start_date, end_date))
     targets_data = targets or targets_tool.get_targets(month).model_dump()
     gaps = baseline_engine.calculate_gap_vs_targets(baseline, targets_data)
-    opportunities = await get_opportunities(month=month, geo=geo, targets=targets)
-    return {
+    opportunities = _find_opportunities(month=month, geo=geo, targets=targets)
+    return ORJSONResponse({
         "baseline_forecast": {
             "period": {"start": start_date.isoformat(), "end": end_date.isoformat()},
             "totals": {
@@ -190,5 +208,5 @@ async def analyze(payload: DiscoveryAnalyzeRequest = Body(...)) -> dict:
             },
         },
         "gap_analysis": gaps,
-        "opportunities": opportunities,
-    }
+        "opportunities": [o.model_dump(mode="json") for o in opportunities],
+    })
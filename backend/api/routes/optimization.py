@@ -5,8 +5,11 @@ Endpoints for scenario optimization.
 """
 
 from fastapi import APIRouter, HTTPException, Request, Depends, Body
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
 from typing import List, Optional, Dict, Any, Tuple
 
+from ..responses import ORJSONResponse, pydantic_response
 from models.schemas import PromoScenario, FrontierData, RankedScenarios, ScenarioKPI, DateRange
 from middleware.rate_limit import get_rate_limit
 from middleware.auth import get_current_user
@@ -37,6 +40,10 @@ optimization_engine = ScenarioOptimizationEngine(
 )
 context_engine = ContextEngine(context_tool=context_tool)
 
+# Built once at import; FastAPI otherwise assembles an equivalent adapter on
+# every request for List[PromoScenario] bodies
+_SCENARIO_LIST_ADAPTER = TypeAdapter(List[PromoScenario])
+
 
 @router.post("/optimize")
 @router.post("/generate")
@@ -91,27 +98,39 @@ async def optimize_scenarios(
             for item in results
         ]
 
-        return {
-            "scenarios": results,
+        # Dump models once and serialize with orjson, skipping jsonable_encoder
+        return ORJSONResponse({
+            "scenarios": [
+                {
+                    "scenario": item["scenario"].model_dump(mode="json"),
+                    "kpi": item["kpi"].model_dump(mode="json"),
+                    "rank": item["rank"],
+                    "score": item["score"],
+                }
+                for item in results
+            ],
             "efficient_frontier": {"points": frontier_points, "pareto_optimal": [p["scenario_id"] for p in frontier_points]},
-        }
+        })
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(status_code=500, detail=f"Error optimizing scenarios: {str(exc)}") from exc
 
 
-@router.post("/frontier")
-async def calculate_frontier(
-    scenarios: List[PromoScenario]
-) -> FrontierData:
+@router.post("/frontier", response_model=None)
+async def calculate_frontier(request: Request) -> FrontierData:
     """
     Calculate efficient frontier.
     
     Args:
-        scenarios: List of PromoScenario objects
+        request: Body is a JSON list of PromoScenario objects
     
     Returns:
         FrontierData object
     """
+    try:
+        # pydantic-core parses the raw bytes directly (no intermediate dicts)
+        scenarios = _SCENARIO_LIST_ADAPTER.validate_json(await request.body())
+    except ValidationError as exc:
+        raise RequestValidationError(exc.errors()) from exc
     if not scenarios:
         raise HTTPException(status_code=400, detail="At least one scenario is required")
     
@@ -133,10 +152,9 @@ async def calculate_frontier(
             kpi = evaluation_engine.evaluate_scenario(scenario, baseline, uplift_model, context)
             kpis.append(kpi)
         
-        # Build coordinates (sales, margin) for frontier
-        coordinates: List[Tuple[float, float]] = [
-            (kpi.total_sales, kpi.total_margin) for kpi in kpis
-        ]
+        # Build coordinates (sales, margin) for frontier as parallel arrays
+        sales_coords: List[float] = [kpi.total_sales for kpi in kpis]
+        margin_coords: List[float] = [kpi.total_margin for kpi in kpis]
         
         # Identify Pareto-optimal scenarios (scenarios that are not dominated)
         pareto_optimal: List[bool] = []
@@ -152,11 +170,14 @@ async def calculate_frontier(
                         break
             pareto_optimal.append(is_optimal)
         
-        return FrontierData(
+        # Server-built output from already-validated scenarios; skip
+        # per-element re-validation
+        return pydantic_response(FrontierData.model_construct(
             scenarios=scenarios,
-            coordinates=coordinates,
+            sales_coords=sales_coords,
+            margin_coords=margin_coords,
             pareto_optimal=pareto_optimal
-        )
+        ))
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(status_code=500, detail=f"Error calculating frontier: {str(exc)}") from exc
 
@@ -179,21 +200,24 @@ async def get_frontier_sample(
     return {"frontier": {"points": points, "pareto_optimal": pareto_ids, "x_axis": x_axis, "y_axis": y_axis}}
 
 
-@router.post("/rank")
-async def rank_scenarios(
-    scenarios: List[PromoScenario],
-    weights: Optional[Dict[str, float]] = None
-) -> RankedScenarios:
+@router.post("/rank", response_model=None)
+async def rank_scenarios(request: Request) -> RankedScenarios:
     """
     Rank scenarios by objectives.
     
     Args:
-        scenarios: List of PromoScenario objects
-        weights: Optional objective weights (default: {"sales": 0.6, "margin": 0.4})
+        request: Body holds "scenarios" (list of PromoScenario) and optional
+            "weights" (default: {"sales": 0.6, "margin": 0.4})
     
     Returns:
         RankedScenarios object
     """
+    payload = await request.json()
+    try:
+        scenarios = _SCENARIO_LIST_ADAPTER.validate_python(payload.get("scenarios") or [])
+    except ValidationError as exc:
+        raise RequestValidationError(exc.errors()) from exc
+    weights: Optional[Dict[str, float]] = payload.get("weights")
     if not scenarios:
         raise HTTPException(status_code=400, detail="At least one scenario is required")
     
@@ -236,9 +260,11 @@ async def rank_scenarios(
             
             scenario_scores.append((scenario, composite_score))
         
-        # Sort by score (descending)
+        # Sort by score (descending), then split into parallel lists
         scenario_scores.sort(key=lambda x: x[1], reverse=True)
-        
+        ranked_scenarios: List[PromoScenario] = [s for s, _ in scenario_scores]
+        ranked_scores: List[float] = [score for _, score in scenario_scores]
+
         # Generate rationale
         rationale: Dict[str, str] = {}
         for i, (scenario, score) in enumerate(scenario_scores):
@@ -248,10 +274,12 @@ async def rank_scenarios(
                 f"(Sales weight: {weights.get('sales', 0.5):.2f}, "
                 f"Margin weight: {weights.get('margin', 0.5):.2f})"
             )
-        
-        return RankedScenarios(
-            ranked_scenarios=scenario_scores,
+
+        # trusted, no re-validate: both lists are built server-side above
+        return pydantic_response(RankedScenarios.model_construct(
+            scenarios=ranked_scenarios,
+            scores=ranked_scores,
             rationale=rationale
-        )
+        ))
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(status_code=500, detail=f"Error ranking scenarios: {str(exc)}") from exc
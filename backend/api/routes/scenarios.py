@@ -6,11 +6,15 @@ Endpoints for scenario creation, evaluation, and comparison.
 
 from fastapi import APIRouter, HTTPException, Body, Depends
 from typing import List, Optional, Dict, Any
+from collections import OrderedDict
+import hashlib
 import uuid
 import json
-from pydantic import BaseModel
+import orjson
+from pydantic import BaseModel, TypeAdapter
 from sqlalchemy.orm import Session
 
+from ..responses import ORJSONResponse
 from models.schemas import PromoScenario, ScenarioKPI, ValidationReport, BaselineForecast, DateRange
 from engines.scenario_evaluation_engine import ScenarioEvaluationEngine
 from engines.validation_engine import ValidationEngine
@@ -38,6 +42,40 @@ context_engine = ContextEngine(context_tool=context_tool)
 # In-memory scenario store (legacy fallback)
 SCENARIO_STORE: Dict[str, PromoScenario] = {}
 
+# Built once at import and reused for /compare payload validation; existing
+# PromoScenario instances pass through without re-validation
+_SCENARIO_LIST_ADAPTER = TypeAdapter(List[PromoScenario])
+
+# Sliding-window cache of validation reports keyed by a canonical hash of the
+# (scenario, kpi) payload; identical submissions skip the rule checks
+_VALIDATION_CACHE: "OrderedDict[bytes, ValidationReport]" = OrderedDict()
+_VALIDATION_CACHE_SIZE = 64
+
+
+def _validation_cache_key(scenario: PromoScenario, kpi: Optional[ScenarioKPI]) -> bytes:
+    payload = orjson.dumps(
+        {
+            "scenario": scenario.model_dump(mode="json"),
+            "kpi": kpi.model_dump(mode="json") if kpi else None,
+        },
+        option=orjson.OPT_SORT_KEYS,
+    )
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def _cached_validation(scenario: PromoScenario, kpi: Optional[ScenarioKPI]) -> ValidationReport:
+    """Validate a scenario, reusing the last N reports for identical payloads."""
+    key = _validation_cache_key(scenario, kpi)
+    report = _VALIDATION_CACHE.get(key)
+    if report is not None:
+        _VALIDATION_CACHE.move_to_end(key)
+        return report
+    report = validation_engine.validate_scenario(scenario, kpi)
+    _VALIDATION_CACHE[key] = report
+    if len(_VALIDATION_CACHE) > _VALIDATION_CACHE_SIZE:
+        _VALIDATION_CACHE.popitem(last=False)
+    return report
+
 
 class PromoDateRange(BaseModel):
     start: str
@@ -157,7 +195,7 @@ def _scenario_from_db(row: ScenarioDB) -> PromoScenario:
         channels=_loads(row.channels, []),
         discount_percentage=row.discount_percentage,
         segments=_loads(row.segments, None),
-        metadata=_loads(row.metadata, None),
+        metadata=_loads(row.scenario_metadata, None),
     )
 
 
@@ -174,7 +212,7 @@ def _persist_scenario(db: Session, scenario: PromoScenario, created_by: Optional
         "channels": json.dumps(scenario.channels),
         "discount_percentage": scenario.discount_percentage,
         "segments": json.dumps(scenario.segments) if scenario.segments else None,
-        "metadata": json.dumps(scenario.metadata) if scenario.metadata else None,
+        "scenario_metadata": json.dumps(scenario.metadata) if scenario.metadata else None,
         "created_by": created_by,
     }
     if record:
@@ -246,7 +284,7 @@ async def create_scenario(
         )
     )
     kpi = evaluation_engine.evaluate_scenario(scenario, baseline, uplift_model, context)
-    validation = validation_engine.validate_scenario(scenario)
+    validation = _cached_validation(scenario, None)
 
     _persist_scenario(db, scenario)
     _persist_kpi(db, scenario.id, kpi)
@@ -281,7 +319,7 @@ async def get_scenario(
         )
     )
     kpi = evaluation_engine.evaluate_scenario(scenario, baseline, uplift_model, context)
-    validation = validation_engine.validate_scenario(scenario, kpi)
+    validation = _cached_validation(scenario, kpi)
     _persist_scenario(db, scenario)
     _persist_kpi(db, scenario.id, kpi)
     _persist_validation(db, scenario.id, validation)
@@ -319,7 +357,7 @@ async def update_scenario(
         )
     )
     kpi = evaluation_engine.evaluate_scenario(existing, baseline, uplift_model, context)
-    validation = validation_engine.validate_scenario(existing, kpi)
+    validation = _cached_validation(existing, kpi)
     _persist_scenario(db, existing)
     _persist_kpi(db, existing.id, kpi)
     _persist_validation(db, existing.id, validation)
@@ -345,7 +383,7 @@ async def delete_scenario(
     return {"deleted": True, "scenario_id": scenario_id}
 
 
-@router.post("/evaluate")
+@router.post("/evaluate", response_model=None)
 async def evaluate_scenario(
     scenario: PromoScenario,
     db: Session = Depends(get_session)
@@ -387,7 +425,7 @@ async def evaluate_scenario(
             uplift_model=uplift_model,
             context=context
         )
-        validation = validation_engine.validate_scenario(scenario, kpi)
+        validation = _cached_validation(scenario, kpi)
         _persist_scenario(db, scenario)
         _persist_kpi(db, scenario.id, kpi)
         _persist_validation(db, scenario.id, validation)
@@ -397,7 +435,7 @@ async def evaluate_scenario(
         raise HTTPException(status_code=500, detail=f"Error evaluating scenario: {str(exc)}") from exc
 
 
-@router.post("/{scenario_id}/evaluate")
+@router.post("/{scenario_id}/evaluate", response_model=None)
 async def evaluate_scenario_by_id(
     scenario_id: str,
     db: Session = Depends(get_session)
@@ -411,7 +449,7 @@ async def evaluate_scenario_by_id(
     return await evaluate_scenario(scenario, db)
 
 
-@router.post("/compare")
+@router.post("/compare", response_model=None)
 async def compare_scenarios(
     payload: Any = Body(...),
     db: Session = Depends(get_session)
@@ -443,10 +481,7 @@ async def compare_scenarios(
     if not scenarios:
         raise HTTPException(status_code=400, detail="At least one scenario is required")
 
-    scenarios = [
-        s if isinstance(s, PromoScenario) else PromoScenario.model_validate(s)
-        for s in scenarios
-    ]
+    scenarios = _SCENARIO_LIST_ADAPTER.validate_python(scenarios)
     
     try:
         # Evaluate all scenarios
@@ -489,30 +524,32 @@ async def compare_scenarios(
             else:
                 recommendations.append("One scenario maximizes sales; another maximizes margin")
 
+        # Dump models once and serialize with orjson, skipping jsonable_encoder
+        kpi_payloads = [kpi.model_dump(mode="json") for kpi in kpis]
         doc_scenarios = [
             {
                 "id": s.id,
                 "label": s.name,
-                "kpi": kpis[idx],
+                "kpi": kpi_payloads[idx],
             }
             for idx, s in enumerate(scenarios)
         ]
 
-        return {
-            "scenarios": scenarios,
-            "kpis": kpis,
+        return ORJSONResponse({
+            "scenarios": [s.model_dump(mode="json") for s in scenarios],
+            "kpis": kpi_payloads,
             "comparison_table": comparison_table,
             "recommendations": recommendations,
             "comparison": {
                 "scenarios": doc_scenarios,
                 "summary": summary,
             },
-        }
+        })
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(status_code=500, detail=f"Error comparing scenarios: {str(exc)}") from exc
 
 
-@router.post("/validate")
+@router.post("/validate", response_model=None)
 async def validate_scenario(
     payload: Dict[str, Any] = Body(...),
     db: Session = Depends(get_session)
@@ -542,7 +579,7 @@ async def validate_scenario(
             )
             kpi_obj = evaluation_engine.evaluate_scenario(scenario, baseline, uplift_model, context)
         
-        report = validation_engine.validate_scenario(scenario, kpi_obj)
+        report = _cached_validation(scenario, kpi_obj)
         _persist_validation(db, scenario.id, report)
         db.commit()
         return report
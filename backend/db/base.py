@@ -88,7 +88,7 @@ class Scenario(Base):
     channels = Column(Text)  # JSON array
     discount_percentage = Column(Float, nullable=False)
     segments = Column(Text)  # JSON array
-    metadata = Column(Text)  # JSON object
+    scenario_metadata = Column("metadata", Text)  # JSON object
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     created_by = Column(String(100))
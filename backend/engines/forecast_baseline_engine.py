@@ -13,7 +13,7 @@ Methodology:
 - Gap calculation vs targets
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, List, Any
 from datetime import date
 
 import pandas as pd
@@ -74,8 +74,11 @@ class ForecastBaselineEngine:
         dow_means = hist_df.groupby("day_name")[["sales_value", "margin_value", "units"]].mean()
         overall_means = hist_df[["sales_value", "margin_value", "units"]].mean()
 
-        daily_projections: Dict[date, Dict[str, float]] = {}
-        totals = {"sales_value": 0.0, "margin_value": 0.0, "units": 0.0}
+        # Parallel per-day arrays (SoA); totals are computed on the model
+        dates: List[date] = []
+        sales: List[float] = []
+        margin: List[float] = []
+        units: List[float] = []
 
         for current_date in pd.date_range(start=start_date, end=end_date, freq="D"):
             dow = current_date.day_name()
@@ -84,22 +87,17 @@ class ForecastBaselineEngine:
             else:
                 row = overall_means
 
-            day_projection = {
-                "sales": float(row["sales_value"]),
-                "margin": float(row["margin_value"]),
-                "units": float(row["units"]),
-            }
-            daily_projections[current_date.date()] = day_projection
-            totals["sales_value"] += day_projection["sales"]
-            totals["margin_value"] += day_projection["margin"]
-            totals["units"] += day_projection["units"]
+            dates.append(current_date.date())
+            sales.append(float(row["sales_value"]))
+            margin.append(float(row["margin_value"]))
+            units.append(float(row["units"]))
 
         baseline = BaselineForecast(
             date_range=DateRange(start_date=start_date, end_date=end_date),
-            daily_projections=daily_projections,
-            total_sales=totals["sales_value"],
-            total_margin=totals["margin_value"],
-            total_units=totals["units"],
+            dates=dates,
+            sales=sales,
+            margin=margin,
+            units=units,
             gap_vs_target=None,
         )
 
@@ -81,15 +81,20 @@ class ScenarioEvaluationEngine:
         from datetime import date as date_type
         current_date = scenario.date_range.start_date
         end_date = scenario.date_range.end_date
-        
+
+        # One index over the baseline's parallel arrays for O(1) day lookup
+        day_index = {d: i for i, d in enumerate(baseline.dates)}
+
         while current_date <= end_date:
             # Get baseline projection for this day
-            day_baseline = baseline.daily_projections.get(current_date, {
-                "sales": 0.0,
-                "margin": 0.0,
-                "units": 0.0
-            })
-            
+            idx = day_index.get(current_date)
+            if idx is None:
+                base_sales = base_margin = base_units = 0.0
+            else:
+                base_sales = baseline.sales[idx]
+                base_margin = baseline.margin[idx]
+                base_units = baseline.units[idx]
+
             # Calculate uplift for each department/channel
             for dept in scenario.departments:
                 for channel in scenario.channels:
@@ -106,12 +111,12 @@ class ScenarioEvaluationEngine:
                     dept_factor = 1.0 / len(scenario.departments) if scenario.departments else 1.0
                     channel_factor = 1.0 / len(scenario.channels) if scenario.channels else 1.0
                     
-                    day_sales = day_baseline["sales"] * dept_factor * channel_factor * (1 + uplift_pct)
-                    day_margin_pct = day_baseline["margin"] / day_baseline["sales"] if day_baseline["sales"] > 0 else 0.2
+                    day_sales = base_sales * dept_factor * channel_factor * (1 + uplift_pct)
+                    day_margin_pct = base_margin / base_sales if base_sales > 0 else 0.2
                     # Adjust margin for discount
                     day_margin_pct = max(0.0, day_margin_pct - (scenario.discount_percentage / 100.0))
                     day_margin = day_sales * day_margin_pct
-                    day_units = day_baseline["units"] * dept_factor * channel_factor * (1 + uplift_pct * 0.8)
+                    day_units = base_units * dept_factor * channel_factor * (1 + uplift_pct * 0.8)
                     
                     total_sales += day_sales
                     total_margin += day_margin
@@ -154,7 +159,9 @@ class ScenarioEvaluationEngine:
             "margin_pct_change": ((total_margin - baseline.total_margin) / baseline.total_margin * 100) if baseline.total_margin > 0 else 0.0,
         }
         
-        kpi = ScenarioKPI(
+        # model_construct skips validation; every field comes from trusted
+        # arithmetic above, not user input
+        kpi = ScenarioKPI.model_construct(
             scenario_id=scenario.id or "unknown",
             total_sales=total_sales,
             total_margin=total_margin,
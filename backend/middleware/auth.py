@@ -8,6 +8,10 @@ from fastapi import HTTPException, Depends, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
 from typing import Optional, List
+import base64
+import calendar
+import hmac
+import json
 import os
 import logging
 import hashlib
@@ -21,11 +25,26 @@ from db.base import ApiKey
 logger = logging.getLogger(__name__)
 security = HTTPBearer(auto_error=False)
 
+# Reused verbatim by every 401 response; FastAPI does not mutate it.
+_WWW_AUTH_HEADERS = {"WWW-Authenticate": "Bearer"}
+
 # JWT Configuration
 SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# API keys are stored as keyed BLAKE2b digests: faster than SHA-256 on short
+# inputs and the server-side key doubles as an HMAC, so a leaked key table
+# cannot be verified offline. BLAKE2b keys are capped at 64 bytes.
+API_KEY_PEPPER = os.getenv("API_KEY_PEPPER", SECRET_KEY).encode("utf-8")[:64]
+
+
+def hash_api_key(token: str) -> str:
+    """Hash an API key token for storage and lookup."""
+    return hashlib.blake2b(
+        token.encode("utf-8"), key=API_KEY_PEPPER, digest_size=32
+    ).hexdigest()
+
 
 class Role(str, Enum):
     """User roles for RBAC."""
@@ -51,17 +70,37 @@ class User:
         return any(role in self.roles for role in roles)
 
 
+# All tokens share the same JOSE header, so base64-encode it once instead of
+# per call inside jwt.encode.
+_JWT_HEADER_B64 = base64.urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b"=")
+SECRET_KEY_BYTES = SECRET_KEY.encode("utf-8")
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(obj: dict) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
-    """Create JWT access token."""
+    """
+    Create JWT access token.
+
+    Builds the HS256 compact token directly (cached header + HMAC) instead of
+    going through jose's generic encoder; jwt.decode verifies it as usual.
+    """
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
         expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
+
+    to_encode["exp"] = calendar.timegm(expire.utctimetuple())
+    payload_b64 = base64.urlsafe_b64encode(_dumps(to_encode)).rstrip(b"=")
+    signing_input = _JWT_HEADER_B64 + b"." + payload_b64
+    signature = hmac.new(SECRET_KEY_BYTES, signing_input, hashlib.sha256).digest()
+    return (signing_input + b"." + base64.urlsafe_b64encode(signature).rstrip(b"=")).decode("ascii")
 
 
 def verify_token(token: str) -> dict:
@@ -74,7 +113,7 @@ def verify_token(token: str) -> dict:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
+            headers=_WWW_AUTH_HEADERS,
         )
 
 
@@ -102,13 +141,13 @@ async def get_current_user(
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Authentication required",
-            headers={"WWW-Authenticate": "Bearer"},
+            headers=_WWW_AUTH_HEADERS,
         )
     
     token = credentials.credentials
     # First try API key
     if token.startswith("pk_"):
-        key_hash = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        key_hash = hash_api_key(token)
         api_key = db.query(ApiKey).filter(ApiKey.key_hash == key_hash).one_or_none()
         if not api_key:
             raise HTTPException(
@@ -8,12 +8,34 @@ from fastapi import Request, HTTPException
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 import logging
-import uuid
+import secrets
 from typing import Any, Dict
 
+# Try to reuse the active trace id as the request id (free log/trace correlation)
+try:
+    from opentelemetry import trace as otel_trace  # type: ignore
+    OTEL_AVAILABLE = True
+except (ImportError, SyntaxError):
+    OTEL_AVAILABLE = False
+    otel_trace = None
+
 logger = logging.getLogger(__name__)
 
 
+def generate_request_id() -> str:
+    """
+    Generate a request id for log correlation.
+
+    When tracing is active, reuse the OpenTelemetry trace id so logs and
+    traces share the same identifier; otherwise fall back to a random hex id.
+    """
+    if OTEL_AVAILABLE:
+        ctx = otel_trace.get_current_span().get_span_context()
+        if ctx.is_valid:
+            return format(ctx.trace_id, "032x")
+    return secrets.token_hex(16)
+
+
 class APIError(Exception):
     """Base API error class."""
     def __init__(
@@ -104,14 +126,14 @@ def format_error_response(
             "code": code,
             "message": message,
             "details": details or {},
-            "request_id": request_id or str(uuid.uuid4())
+            "request_id": request_id or generate_request_id()
         }
     }
 
 
 async def api_error_handler(request: Request, exc: APIError) -> JSONResponse:
     """Handle APIError exceptions."""
-    request_id = request.state.request_id if hasattr(request.state, "request_id") else None
+    request_id = getattr(request.state, "request_id", None)
     return JSONResponse(
         status_code=exc.status_code,
         content=format_error_response(
@@ -126,7 +148,7 @@ async def api_error_handler(request: Request, exc: APIError) -> JSONResponse:
 
 async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
     """Handle HTTPException."""
-    request_id = request.state.request_id if hasattr(request.state, "request_id") else None
+    request_id = getattr(request.state, "request_id", None)
     
     # Map status codes to error codes
     error_codes = {
@@ -156,7 +178,7 @@ async def validation_exception_handler(
     exc: RequestValidationError
 ) -> JSONResponse:
     """Handle request validation errors."""
-    request_id = request.state.request_id if hasattr(request.state, "request_id") else None
+    request_id = getattr(request.state, "request_id", None)
     
     errors = []
     for error in exc.errors():
@@ -181,7 +203,7 @@ async def validation_exception_handler(
 
 async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     """Handle unexpected exceptions."""
-    request_id = request.state.request_id if hasattr(request.state, "request_id") else None
+    request_id = getattr(request.state, "request_id", None)
     
     logger.exception(f"Unhandled exception: {str(exc)}")
     
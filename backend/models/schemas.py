@@ -8,13 +8,19 @@ This module defines all the data structures used throughout the application.
 
 from typing import List, Optional, Dict, Any, Tuple
 from datetime import date, datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, computed_field, field_serializer
 
 
 # Core Domain Models
 
 class DateRange(BaseModel):
-    """Date range tuple."""
+    """Date range tuple.
+
+    Frozen: instances are built in bulk during evaluation and never mutated,
+    so immutability keeps them hashable and cheap to share across caches.
+    """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     start_date: date
     end_date: date
 
@@ -54,14 +60,35 @@ class PromoOpportunity(BaseModel):
 
 
 class BaselineForecast(BaseModel):
-    """Baseline forecast without promotions."""
+    """Baseline forecast without promotions.
+
+    Daily projections are stored structure-of-arrays: `dates` plus parallel
+    `sales`/`margin`/`units` lists, so a 90-day horizon is four flat arrays
+    instead of 90 per-day dicts. Totals are derived from the arrays rather
+    than stored redundantly.
+    """
     date_range: DateRange
-    daily_projections: Dict[date, Dict[str, float]]  # date -> {sales, margin, units}
-    total_sales: float
-    total_margin: float
-    total_units: float
+    dates: List[date]
+    sales: List[float]
+    margin: List[float]
+    units: List[float]
     gap_vs_target: Optional[Dict[str, float]] = None
 
+    @computed_field
+    @property
+    def total_sales(self) -> float:
+        return float(sum(self.sales))
+
+    @computed_field
+    @property
+    def total_margin(self) -> float:
+        return float(sum(self.margin))
+
+    @computed_field
+    @property
+    def total_units(self) -> float:
+        return float(sum(self.units))
+
 
 class UpliftModel(BaseModel):
     """Uplift model with coefficients."""
@@ -105,6 +132,8 @@ class CreativeBrief(BaseModel):
 
 class AssetSpec(BaseModel):
     """Asset specification."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     asset_type: str  # homepage_hero, banner, instore, email_header
     copy_text: str
     layout_hints: Optional[Dict[str, Any]] = None
@@ -117,6 +146,10 @@ class CampaignPlan(BaseModel):
     timeline: Dict[date, List[str]]
     execution_details: Dict[str, Any]
 
+    @field_serializer("timeline", when_used="json")
+    def _serialize_timeline(self, value: Dict[date, List[str]]):
+        return {k.isoformat(): v for k, v in value.items()}
+
 
 class PostMortemReport(BaseModel):
     """Post-mortem analysis report."""
@@ -139,6 +172,8 @@ class Insights(BaseModel):
 
 class Event(BaseModel):
     """Event or holiday."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     name: str
     date: date
     type: str  # holiday, local_event, seasonal
@@ -165,6 +200,8 @@ class PromoCampaign(BaseModel):
 
 class Segment(BaseModel):
     """Customer segment."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: str
     name: str
     description: Optional[str] = None
@@ -173,6 +210,8 @@ class Segment(BaseModel):
 
 class Targets(BaseModel):
     """Business targets."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     month: str
     sales_target: float
     margin_target: float
@@ -182,6 +221,8 @@ class Targets(BaseModel):
 
 class Constraints(BaseModel):
     """Promotional constraints."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     max_discount: float
     min_margin: float
     budget_limit: Optional[float] = None
@@ -227,15 +268,25 @@ class ConstraintCheck(BaseModel):
 
 
 class FrontierData(BaseModel):
-    """Efficient frontier data."""
+    """Efficient frontier data.
+
+    Coordinates are stored structure-of-arrays: parallel sales/margin lists
+    serialize as two flat float arrays instead of N boxed tuples.
+    """
     scenarios: List[PromoScenario]
-    coordinates: List[Tuple[float, float]]  # (sales, margin)
+    sales_coords: List[float]
+    margin_coords: List[float]
     pareto_optimal: List[bool]
 
 
 class RankedScenarios(BaseModel):
-    """Ranked scenarios with rationale."""
-    ranked_scenarios: List[Tuple[PromoScenario, float]]  # (scenario, score)
+    """Ranked scenarios with rationale.
+
+    Scenarios and scores are parallel lists in rank order; two flat arrays
+    serialize faster than N (scenario, score) tuples.
+    """
+    scenarios: List[PromoScenario]
+    scores: List[float]
     rationale: Dict[str, str]
 
 
@@ -258,8 +309,38 @@ class StorageResult(BaseModel):
 
 
 class AnalysisDataset(BaseModel):
-    """Prepared dataset for analysis."""
-    data: Dict[str, Any]  # DataFrame or similar
+    """Prepared dataset for analysis.
+
+    data_arrow holds the frame as Arrow IPC stream bytes (one contiguous
+    buffer) instead of a dict-of-rows; JSON output base64-encodes it once so
+    serialization is a straight string copy.
+    """
+    data_arrow: bytes  # Arrow IPC stream of the prepared DataFrame
     metadata: Dict[str, Any]
     filters_applied: Dict[str, Any]
 
+    @field_serializer("data_arrow", when_used="json")
+    def _serialize_data_arrow(self, value: bytes) -> str:
+        import base64
+        return base64.b64encode(value).decode("ascii")
+
+
+# Resolve forward refs ('Event', 'SeasonalityProfile') and finish building the
+# schema cores of every nesting model here, at import time, so pydantic-core
+# shares the inner validator/serializer instances instead of assembling them
+# lazily on first use per model.
+for _model in (
+    PromoContext,
+    PromoScenario,
+    PromoOpportunity,
+    BaselineForecast,
+    ScenarioKPI,
+    CampaignPlan,
+    PromoCampaign,
+    ComparisonReport,
+    FrontierData,
+    RankedScenarios,
+):
+    _model.model_rebuild()
+del _model
+
@@ -0,0 +1,26 @@
+"""
+Shared test fixtures.
+
+One session-scoped TestClient is reused across all route test modules, so
+the FastAPI app and its pydantic schema cores are only assembled once per
+test run.
+"""
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+
+from api.main import app
+
+
+@pytest.fixture(scope="session")
+def client() -> TestClient:
+    return TestClient(app)
+
+
+@pytest_asyncio.fixture
+async def aclient():
+    """Async client against the app's ASGI stack; lets independent endpoint
+    calls run concurrently in one event loop via asyncio.gather."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        yield c
@@ -1,13 +1,5 @@
-import pytest
 from fastapi.testclient import TestClient
 
-from api.main import app
-
-
-@pytest.fixture(scope="module")
-def client() -> TestClient:
-    return TestClient(app)
-
 
 def test_generate_brief(client: TestClient):
     """Test creative brief generation."""
@@ -1,13 +1,5 @@
-import pytest
 from fastapi.testclient import TestClient
 
-from api.main import app
-
-
-@pytest.fixture(scope="module")
-def client() -> TestClient:
-    return TestClient(app)
-
 
 def test_get_baseline(client: TestClient):
     """Test baseline forecast endpoint."""
@@ -23,7 +15,8 @@ def test_get_baseline(client: TestClient):
     assert "total_sales" in data
     assert "total_margin" in data
     assert "total_units" in data
-    assert "daily_projections" in data
+    assert "dates" in data and "sales" in data
+    assert len(data["dates"]) == len(data["sales"])
     assert data["total_sales"] > 0
 
 
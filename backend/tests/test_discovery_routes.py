@@ -1,13 +1,5 @@
-import pytest
 from fastapi.testclient import TestClient
 
-from api.main import app
-
-
-@pytest.fixture(scope="module")
-def client() -> TestClient:
-    return TestClient(app)
-
 
 def test_baseline_endpoint(client: TestClient):
     resp = client.get(
@@ -19,7 +11,8 @@ def test_baseline_endpoint(client: TestClient):
     assert data["total_sales"] > 0
     assert data["total_margin"] > 0
     assert data["total_units"] > 0
-    assert len(data["daily_projections"]) == 7
+    assert len(data["dates"]) == 7
+    assert len(data["sales"]) == 7
 
 
 def test_discovery_opportunities(client: TestClient):
@@ -1,13 +1,5 @@
-import pytest
 from fastapi.testclient import TestClient
 
-from api.main import app
-
-
-@pytest.fixture(scope="module")
-def client() -> TestClient:
-    return TestClient(app)
-
 
 def test_optimize_scenarios(client: TestClient):
     """Test optimization endpoint."""
@@ -61,9 +53,11 @@ def test_calculate_frontier(client: TestClient):
     assert response.status_code == 200
     data = response.json()
     assert "scenarios" in data
-    assert "coordinates" in data
+    assert "sales_coords" in data
+    assert "margin_coords" in data
     assert "pareto_optimal" in data
-    assert len(data["coordinates"]) == 2
+    assert len(data["sales_coords"]) == 2
+    assert len(data["margin_coords"]) == 2
 
 
 def test_rank_scenarios(client: TestClient):
@@ -102,6 +96,9 @@ def test_rank_scenarios(client: TestClient):
     )
     assert response.status_code == 200
     data = response.json()
-    assert "ranked_scenarios" in data
+    assert "scenarios" in data
+    assert "scores" in data
     assert "rationale" in data
-    assert len(data["ranked_scenarios"]) == 2
+    assert len(data["scenarios"]) == 2
+    assert len(data["scores"]) == 2
+    assert data["scores"] == sorted(data["scores"], reverse=True)
@@ -1,18 +1,50 @@
-import pytest
-from fastapi.testclient import TestClient
-from datetime import date, timedelta
+import asyncio
 
-from api.main import app
+import pytest
+from httpx import AsyncClient
 
+_SCENARIO = {
+    "id": "test-scenario-1",
+    "name": "Test Scenario",
+    "date_range": {
+        "start_date": "2024-10-01",
+        "end_date": "2024-10-07"
+    },
+    "departments": ["TV"],
+    "channels": ["online"],
+    "discount_percentage": 15.0
+}
 
-@pytest.fixture(scope="module")
-def client() -> TestClient:
-    return TestClient(app)
+_SCENARIO_PAIR = [
+    {
+        "id": "scenario-1",
+        "name": "Conservative",
+        "date_range": {
+            "start_date": "2024-10-01",
+            "end_date": "2024-10-07"
+        },
+        "departments": ["TV"],
+        "channels": ["online"],
+        "discount_percentage": 10.0
+    },
+    {
+        "id": "scenario-2",
+        "name": "Aggressive",
+        "date_range": {
+            "start_date": "2024-10-01",
+            "end_date": "2024-10-07"
+        },
+        "departments": ["TV"],
+        "channels": ["online"],
+        "discount_percentage": 20.0
+    }
+]
 
 
-def test_create_scenario(client: TestClient):
+@pytest.mark.asyncio
+async def test_create_scenario(aclient: AsyncClient):
     """Test scenario creation endpoint."""
-    response = client.post(
+    response = await aclient.post(
         "/api/v1/scenarios/create",
         json={
             "brief": {
@@ -37,42 +69,20 @@ def test_create_scenario(client: TestClient):
     assert "validation" in data
 
 
-def test_evaluate_scenario(client: TestClient):
+@pytest.mark.asyncio
+async def test_evaluate_scenario(aclient: AsyncClient):
     """Test scenario evaluation endpoint."""
-    scenario = {
-        "id": "test-scenario-1",
-        "name": "Test Scenario",
-        "date_range": {
-            "start_date": "2024-10-01",
-            "end_date": "2024-10-07"
-        },
-        "departments": ["TV"],
-        "channels": ["online"],
-        "discount_percentage": 15.0
-    }
-    
-    response = client.post("/api/v1/scenarios/evaluate", json=scenario)
+    response = await aclient.post("/api/v1/scenarios/evaluate", json=_SCENARIO)
     assert response.status_code == 200
     data = response.json()
     assert "kpi" in data
     assert data["kpi"]["total_sales"] > 0
 
 
-def test_validate_scenario(client: TestClient):
+@pytest.mark.asyncio
+async def test_validate_scenario(aclient: AsyncClient):
     """Test scenario validation endpoint."""
-    scenario = {
-        "id": "test-scenario-1",
-        "name": "Test Scenario",
-        "date_range": {
-            "start_date": "2024-10-01",
-            "end_date": "2024-10-07"
-        },
-        "departments": ["TV"],
-        "channels": ["online"],
-        "discount_percentage": 15.0
-    }
-    
-    response = client.post("/api/v1/scenarios/validate", json=scenario)
+    response = await aclient.post("/api/v1/scenarios/validate", json=_SCENARIO)
     assert response.status_code == 200
     data = response.json()
     assert "is_valid" in data
@@ -80,37 +90,26 @@ def test_validate_scenario(client: TestClient):
     assert "checks_passed" in data
 
 
-def test_compare_scenarios(client: TestClient):
+@pytest.mark.asyncio
+async def test_compare_scenarios(aclient: AsyncClient):
     """Test scenario comparison endpoint."""
-    scenarios = [
-        {
-            "id": "scenario-1",
-            "name": "Conservative",
-            "date_range": {
-                "start_date": "2024-10-01",
-                "end_date": "2024-10-07"
-            },
-            "departments": ["TV"],
-            "channels": ["online"],
-            "discount_percentage": 10.0
-        },
-        {
-            "id": "scenario-2",
-            "name": "Aggressive",
-            "date_range": {
-                "start_date": "2024-10-01",
-                "end_date": "2024-10-07"
-            },
-            "departments": ["TV"],
-            "channels": ["online"],
-            "discount_percentage": 20.0
-        }
-    ]
-    
-    response = client.post("/api/v1/scenarios/compare", json=scenarios)
+    response = await aclient.post("/api/v1/scenarios/compare", json=_SCENARIO_PAIR)
     assert response.status_code == 200
     data = response.json()
     assert "scenarios" in data
     assert "kpis" in data
     assert "comparison_table" in data
     assert len(data["kpis"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_scenario_endpoints(aclient: AsyncClient):
+    """Independent endpoints dispatched concurrently in one event loop."""
+    evaluate, validate, compare = await asyncio.gather(
+        aclient.post("/api/v1/scenarios/evaluate", json=_SCENARIO),
+        aclient.post("/api/v1/scenarios/validate", json=_SCENARIO),
+        aclient.post("/api/v1/scenarios/compare", json=_SCENARIO_PAIR),
+    )
+    assert evaluate.status_code == 200
+    assert validate.status_code == 200
+    assert compare.status_code == 200
@@ -2,8 +2,39 @@
 Tools module.
 
 Imports are intentionally deferred to avoid loading optional dependencies by
-default. Import tools directly from their modules, e.g.
-`from backend.tools.sales_data_tool import SalesDataTool`.
+default: a PEP 562 ``__getattr__`` resolves each tool class from its module on
+first attribute access, so ``from tools import WeatherTool`` works without
+importing the other eleven tools. Importing directly from the submodule, e.g.
+``from tools.sales_data_tool import SalesDataTool``, remains equivalent.
 """
 
-__all__ = []
+import importlib
+
+# Tool class -> defining submodule; only the accessed one is imported
+_TOOL_MODULES = {
+    "CDPTool": "cdp_tool",
+    "ContextDataTool": "context_data_tool",
+    "DataCleaningTool": "data_cleaner",
+    "DataMergerTool": "data_merger",
+    "DataValidationTool": "data_validator",
+    "DatabaseLoaderTool": "db_loader",
+    "PromoCatalogTool": "promo_catalog_tool",
+    "PromoProcessor": "promo_processor",
+    "SalesDataTool": "sales_data_tool",
+    "TargetsConfigTool": "targets_config_tool",
+    "WeatherTool": "weather_tool",
+    "XLSBReaderTool": "xlsb_reader",
+}
+
+__all__ = list(_TOOL_MODULES)
+
+
+def __getattr__(name: str):
+    module_name = _TOOL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __package__)
+    attr = getattr(module, name)
+    # Cache on the package so subsequent lookups skip __getattr__
+    globals()[name] = attr
+    return attr
@@ -13,6 +13,17 @@ from datetime import date, timedelta
 
 from models.schemas import Event, SeasonalityProfile, DateRange
 
+# Static fixture shared by every call; geo-specific patterns would move this
+# back into the tool
+_WEEKEND_PATTERNS: Dict[str, float] = {"Saturday": 1.15, "Sunday": 0.9}
+
+# Event fixtures validated once at import; get_events only swaps the date in
+# via model_copy instead of re-running full validation per call
+_EVENT_TEMPLATES = (
+    Event(name="Payday weekend", date=date(2000, 1, 1), type="seasonal", impact="medium"),
+    Event(name="Gaming launch week", date=date(2000, 1, 1), type="local_event", impact="high"),
+)
+
 
 class ContextDataTool:
     """Tool for accessing external context data (events, holidays, seasonality)."""
@@ -33,6 +44,8 @@ class ContextDataTool:
                 "Sunday": 0.85,
             },
         )
+        # One profile per geo; built lazily, then reused across calls
+        self._profile_cache: Dict[str, SeasonalityProfile] = {}
     
     def get_events(
         self,
@@ -53,8 +66,8 @@ class ContextDataTool:
         span_days = (end_date - start_date).days
         anchor = start_date + timedelta(days=min(span_days // 2, 7))
         return [
-            Event(name="Payday weekend", date=anchor, type="seasonal", impact="medium"),
-            Event(name="Gaming launch week", date=anchor + timedelta(days=3), type="local_event", impact="high"),
+            _EVENT_TEMPLATES[0].model_copy(update={"date": anchor}),
+            _EVENT_TEMPLATES[1].model_copy(update={"date": anchor + timedelta(days=3)}),
         ]
     
     def get_seasonality_profile(
@@ -70,8 +83,12 @@ class ContextDataTool:
         Returns:
             SeasonalityProfile with seasonal patterns
         """
-        profile = self._seasonality_defaults.model_copy()
-        profile.geo = geo
+        profile = self._profile_cache.get(geo)
+        if profile is None:
+            # update= folds the geo in during the copy, avoiding a second
+            # attribute-set pass
+            profile = self._seasonality_defaults.model_copy(update={"geo": geo})
+            self._profile_cache[geo] = profile
         return profile
     
     def get_weekend_patterns(
@@ -87,4 +104,4 @@ class ContextDataTool:
         Returns:
             Dictionary with weekend pattern data
         """
-        return {"Saturday": 1.15, "Sunday": 0.9}
+        return _WEEKEND_PATTERNS
@@ -8,6 +8,7 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional
 from datetime import datetime
+from types import MappingProxyType
 import logging
 import re
 
@@ -17,8 +18,10 @@ logger = logging.getLogger(__name__)
 class DataCleaningTool:
     """Tool for cleaning and standardizing data formats."""
     
-    # Standard department mappings
-    DEPARTMENT_MAPPING = {
+    # Standard department mappings (read-only; interned keys keep dict
+    # lookups on CPython's identity fast path and guard against mutation
+    # from concurrent agent code)
+    DEPARTMENT_MAPPING = MappingProxyType({
         'tv': 'TV',
         'television': 'TV',
         'tvs': 'TV',
@@ -31,18 +34,22 @@ class DataCleaningTool:
         'phone': 'Smartphones',
         'laptop': 'Computers',
         'computer': 'Computers',
-    }
-    
+    })
+
     # Standard channel mappings
-    CHANNEL_MAPPING = {
+    CHANNEL_MAPPING = MappingProxyType({
         'web': 'online',
         'online': 'online',
         'store': 'offline',
         'stores': 'offline',
         'offline': 'offline',
         'retail': 'offline',
-    }
+    })
     
+    # Bumped whenever the cleaning pipeline's output contract changes;
+    # frames tagged with the current version skip re-cleaning entirely
+    CLEAN_SCHEMA_VERSION = 1
+
     def __init__(self):
         self.required_columns = ['date', 'channel', 'department', 'sales_value', 'margin_value', 'units']
     
@@ -60,7 +67,12 @@ class DataCleaningTool:
         if df.empty:
             logger.warning("Empty DataFrame provided")
             return df
-        
+
+        # Already-clean frames (e.g. round-tripped through the merger) skip
+        # the whole pipeline
+        if df.attrs.get('cleaned_schema_version') == self.CLEAN_SCHEMA_VERSION:
+            return df
+
         # Apply schema mapping if provided
         if schema:
             df = df.rename(columns=schema)
@@ -92,28 +104,46 @@ class DataCleaningTool:
         # Validate required columns
         df_clean = self._validate_columns(df_clean)
         
+        df_clean.attrs['cleaned_schema_version'] = self.CLEAN_SCHEMA_VERSION
         logger.info(f"Cleaned DataFrame: {len(df_clean)} rows, {len(df_clean.columns)} columns")
         return df_clean
     
+    # Formats seen in source exports; tried in order against a sample before
+    # falling back to per-value inference
+    DATE_FORMATS = ('%Y-%m-%d', '%d.%m.%Y', '%m/%d/%Y', '%Y-%m-%dT%H:%M:%S')
+
+    def _detect_date_format(self, series: pd.Series) -> Optional[str]:
+        """Return the first known format that parses a sample of the column."""
+        sample = series.dropna().astype(str).head(20)
+        if sample.empty:
+            return None
+        for fmt in self.DATE_FORMATS:
+            if pd.to_datetime(sample, format=fmt, errors='coerce').notna().all():
+                return fmt
+        return None
+
     def _clean_dates(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean and standardize date column."""
         date_columns = ['date', 'datum', 'day', 'transaction_date']
-        
+
         for col in date_columns:
             if col in df.columns:
-                # Convert to datetime
-                df[col] = pd.to_datetime(df[col], errors='coerce', infer_datetime_format=True)
-                # Format as ISO date string
-                df[col] = df[col].dt.strftime('%Y-%m-%d')
+                # Keep the column as datetime64: int64 storage sorts and
+                # compares natively, and ISO formatting belongs at the API
+                # boundary, not in the stored frame. An explicit format hits
+                # pandas' C parser; per-value inference is the fallback.
+                fmt = self._detect_date_format(df[col])
+                if fmt is not None:
+                    df[col] = pd.to_datetime(df[col], format=fmt, errors='coerce', cache=True)
+                else:
+                    df[col] = pd.to_datetime(df[col], errors='coerce')
                 # Rename to 'date'
                 if col != 'date':
-                    df = df.rename(columns={col: 'date'})
+                    df = df.rename(columns={col: 'date'}, copy=False)
                 break
-        
-        # Remove rows with invalid dates
-        if 'date' in df.columns:
-            df = df[df['date'].notna()]
-        
+
+        # Invalid dates are NaN here; they are dropped with the other
+        # required-column gaps in one pass in _handle_missing_values
         return df
     
     def _clean_channels(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -122,17 +152,16 @@ class DataCleaningTool:
         
         for col in channel_columns:
             if col in df.columns:
-                # Normalize values
-                df[col] = df[col].astype(str).str.lower().str.strip()
-                # Map to standard values
-                df[col] = df[col].map(self.CHANNEL_MAPPING).fillna(df[col])
-                # Validate
-                df[col] = df[col].apply(
-                    lambda x: x if x in ['online', 'offline'] else None
+                # Normalize once, then remap per category (O(#unique), not
+                # O(#rows)); unmapped values become NaN automatically
+                cat = df[col].astype(str).str.lower().str.strip().astype('category')
+                mapped = cat.cat.categories.map(self.CHANNEL_MAPPING)
+                df[col] = pd.Categorical(
+                    mapped.take(cat.cat.codes), categories=['online', 'offline']
                 )
                 # Rename to 'channel'
                 if col != 'channel':
-                    df = df.rename(columns={col: 'channel'})
+                    df = df.rename(columns={col: 'channel'}, copy=False)
                 break
         
         return df
@@ -143,15 +172,17 @@ class DataCleaningTool:
         
         for col in dept_columns:
             if col in df.columns:
-                # Normalize values
-                df[col] = df[col].astype(str).str.strip()
-                # Map common variations
-                df[col] = df[col].str.lower().map(self.DEPARTMENT_MAPPING).fillna(df[col])
-                # Capitalize first letter
-                df[col] = df[col].str.capitalize()
+                # Map and capitalize per category (O(#unique)) instead of
+                # running three string passes over every row
+                cat = df[col].astype(str).str.strip().astype('category')
+                mapped = pd.Index([
+                    self.DEPARTMENT_MAPPING.get(c.lower(), c).capitalize()
+                    for c in cat.cat.categories
+                ])
+                df[col] = pd.Categorical(mapped.take(cat.cat.codes))
                 # Rename to 'department'
                 if col != 'department':
-                    df = df.rename(columns={col: 'department'})
+                    df = df.rename(columns={col: 'department'}, copy=False)
                 break
         
         return df
@@ -165,33 +196,49 @@ class DataCleaningTool:
             'discount_pct': ['discount', 'discount_pct', 'discount_percent', 'discount_%']
         }
         
+        # Pick the first source present per target, rename once, then coerce
+        # each target column in a single pass
+        rename_map = {}
         for target_col, source_cols in numeric_columns.items():
             for source_col in source_cols:
                 if source_col in df.columns:
-                    # Convert to numeric, handling errors
-                    df[target_col] = pd.to_numeric(df[source_col], errors='coerce')
-                    # Remove negative values (except for margin which can be negative)
-                    if target_col != 'margin_value':
-                        df[target_col] = df[target_col].clip(lower=0)
-                    # Rename if different
-                    if source_col != target_col and target_col not in df.columns:
-                        df = df.rename(columns={source_col: target_col})
+                    if source_col != target_col:
+                        rename_map[source_col] = target_col
                     break
-        
+
+        if rename_map:
+            df = df.rename(columns=rename_map, copy=False)
+
+        # Collect all coerced columns and assign them in one pass, so the
+        # BlockManager consolidates once instead of per column
+        numeric_out = {}
+        for target_col in numeric_columns:
+            if target_col in df.columns:
+                arr = pd.to_numeric(df[target_col], errors='coerce').to_numpy(dtype=np.float64)
+                # Remove negative values (except for margin which can be negative)
+                if target_col != 'margin_value':
+                    np.maximum(arr, 0.0, out=arr)
+                numeric_out[target_col] = arr
+
+        if numeric_out:
+            df = df.assign(**numeric_out)
+
         return df
     
     def _handle_missing_values(self, df: pd.DataFrame) -> pd.DataFrame:
         """Handle missing values appropriately."""
-        # For required columns, drop rows with missing values
+        # For required columns, accumulate one keep-mask and filter once at
+        # the end instead of materializing a new frame per column
         required = ['date', 'channel', 'department', 'sales_value', 'units']
+        keep_mask = np.ones(len(df), dtype=bool)
         for col in required:
             if col in df.columns:
-                before = len(df)
-                df = df[df[col].notna()]
-                after = len(df)
-                if before != after:
-                    logger.warning(f"Dropped {before - after} rows with missing {col}")
-        
+                col_mask = df[col].notna().to_numpy()
+                dropped = int(keep_mask.sum() - (keep_mask & col_mask).sum())
+                if dropped:
+                    logger.warning(f"Dropped {dropped} rows with missing {col}")
+                keep_mask &= col_mask
+
         # For margin_value, fill with calculated value if sales_value exists
         if 'margin_value' in df.columns and 'sales_value' in df.columns:
             missing_margin = df['margin_value'].isna() & df['sales_value'].notna()
@@ -203,7 +250,10 @@ class DataCleaningTool:
         # For discount_pct, set to 0 if missing (no promo)
         if 'discount_pct' in df.columns:
             df['discount_pct'] = df['discount_pct'].fillna(0)
-        
+
+        if not keep_mask.all():
+            df = df.loc[keep_mask]
+
         return df
     
     def _remove_duplicates(self, df: pd.DataFrame) -> pd.DataFrame:
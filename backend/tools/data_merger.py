@@ -4,6 +4,7 @@ Data Merger Tool for Data Analyst Agent
 Merges multiple data files handling overlaps and date ranges.
 """
 
+import numpy as np
 import pandas as pd
 from typing import List, Dict, Optional, Literal
 from datetime import datetime
@@ -69,7 +70,7 @@ class DataMergerTool:
     
     def _merge_union(self, dfs: List[pd.DataFrame]) -> pd.DataFrame:
         """Merge keeping all records, removing duplicates."""
-        merged = pd.concat(dfs, ignore_index=True)
+        merged = pd.concat(dfs, ignore_index=True, copy=False)
         
         # Remove duplicates based on date, channel, department
         key_cols = ['date', 'channel', 'department']
@@ -80,7 +81,7 @@ class DataMergerTool:
         if before != after:
             logger.info(f"Removed {before - after} duplicate records in union merge")
         
-        return merged.sort_values('date').reset_index(drop=True)
+        return merged.sort_values('date', kind='stable', ignore_index=True)
     
     def _merge_intersect(self, dfs: List[pd.DataFrame]) -> pd.DataFrame:
         """Merge keeping only records present in all DataFrames."""
@@ -89,40 +90,47 @@ class DataMergerTool:
         
         # Find intersection of date/channel/department combinations
         key_cols = ['date', 'channel', 'department']
-        
-        # Get all unique combinations from first DataFrame
-        intersection = set(
-            dfs[0][key_cols].apply(tuple, axis=1)
-        )
-        
-        # Intersect with all other DataFrames
-        for df in dfs[1:]:
-            combinations = set(df[key_cols].apply(tuple, axis=1))
-            intersection = intersection & combinations
-        
+
+        # Factorize the key columns once across all frames so codes are
+        # comparable, then pack each row's codes into one int64: the
+        # intersection and filtering below are flat integer scans with no
+        # per-row Python objects
+        combined = pd.concat([df[key_cols] for df in dfs], ignore_index=True, copy=False)
+        packed = np.zeros(len(combined), dtype=np.int64)
+        for col in key_cols:
+            codes, uniques = pd.factorize(combined[col])
+            # +1 keeps NaN (code -1) distinct from valid combinations
+            packed = packed * (len(uniques) + 1) + (codes.astype(np.int64) + 1)
+
+        offsets = np.cumsum([0] + [len(df) for df in dfs])
+        keys = [packed[offsets[i]:offsets[i + 1]] for i in range(len(dfs))]
+
+        intersection = keys[0]
+        for key_arr in keys[1:]:
+            intersection = np.intersect1d(intersection, key_arr)
+
         # Filter all DataFrames to intersection
-        filtered_dfs = []
-        for df in dfs:
-            mask = df[key_cols].apply(tuple, axis=1).isin(intersection)
-            filtered_dfs.append(df[mask])
+        filtered_dfs = [
+            df[np.isin(key_arr, intersection)] for df, key_arr in zip(dfs, keys)
+        ]
         
         # Merge filtered DataFrames
-        merged = pd.concat(filtered_dfs, ignore_index=True)
+        merged = pd.concat(filtered_dfs, ignore_index=True, copy=False)
         merged = merged.drop_duplicates(subset=key_cols, keep='last')
         
         logger.info(f"Intersect merge: {len(merged)} records from {len(intersection)} unique combinations")
-        return merged.sort_values('date').reset_index(drop=True)
+        return merged.sort_values('date', kind='stable', ignore_index=True)
     
     def _merge_overwrite(self, dfs: List[pd.DataFrame]) -> pd.DataFrame:
         """Merge with later files overwriting earlier ones."""
-        merged = pd.concat(dfs, ignore_index=True)
+        merged = pd.concat(dfs, ignore_index=True, copy=False)
         
         # Keep last occurrence for each date/channel/department combination
         key_cols = ['date', 'channel', 'department']
         merged = merged.drop_duplicates(subset=key_cols, keep='last')
         
         logger.info(f"Overwrite merge: {len(merged)} records (later files overwrite earlier)")
-        return merged.sort_values('date').reset_index(drop=True)
+        return merged.sort_values('date', kind='stable', ignore_index=True)
     
     def detect_overlaps(self, dfs: Dict[str, pd.DataFrame]) -> Dict:
         """
@@ -132,32 +140,39 @@ class DataMergerTool:
             Dictionary with overlap information
         """
         overlaps = []
-        
-        file_list = list(dfs.items())
-        for i, (path1, df1) in enumerate(file_list):
-            if df1 is None or df1.empty or 'date' not in df1.columns:
+
+        # Scan each date column once up front instead of re-aggregating
+        # min/max inside an O(F^2) pair loop
+        paths = []
+        starts = []
+        ends = []
+        for path, df in dfs.items():
+            if df is None or df.empty or 'date' not in df.columns:
                 continue
-            
-            date_range1 = (df1['date'].min(), df1['date'].max())
-            
-            for j, (path2, df2) in enumerate(file_list[i+1:], start=i+1):
-                if df2 is None or df2.empty or 'date' not in df2.columns:
-                    continue
-                
-                date_range2 = (df2['date'].min(), df2['date'].max())
-                
-                # Check for overlap
-                if date_range1[0] <= date_range2[1] and date_range2[0] <= date_range1[1]:
-                    overlap_start = max(date_range1[0], date_range2[0])
-                    overlap_end = min(date_range1[1], date_range2[1])
-                    
-                    overlaps.append({
-                        'file1': path1,
-                        'file2': path2,
-                        'overlap_start': overlap_start,
-                        'overlap_end': overlap_end,
-                        'overlap_days': (pd.to_datetime(overlap_end) - pd.to_datetime(overlap_start)).days + 1
-                    })
+            paths.append(path)
+            starts.append(df['date'].min())
+            ends.append(df['date'].max())
+
+        if paths:
+            start_arr = pd.to_datetime(pd.Series(starts)).to_numpy()
+            end_arr = pd.to_datetime(pd.Series(ends)).to_numpy()
+
+            # Broadcast the interval test over all pairs; keep i < j only
+            overlap = (start_arr[:, None] <= end_arr[None, :]) & (start_arr[None, :] <= end_arr[:, None])
+            pair_i, pair_j = np.nonzero(np.triu(overlap, k=1))
+
+            overlap_starts = np.maximum(start_arr[pair_i], start_arr[pair_j])
+            overlap_ends = np.minimum(end_arr[pair_i], end_arr[pair_j])
+            overlap_days = ((overlap_ends - overlap_starts) // np.timedelta64(1, 'D')).astype(int) + 1
+
+            for k in range(len(pair_i)):
+                overlaps.append({
+                    'file1': paths[pair_i[k]],
+                    'file2': paths[pair_j[k]],
+                    'overlap_start': pd.Timestamp(overlap_starts[k]),
+                    'overlap_end': pd.Timestamp(overlap_ends[k]),
+                    'overlap_days': int(overlap_days[k]),
+                })
         
         return {
             'has_overlaps': len(overlaps) > 0,
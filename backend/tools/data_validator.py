@@ -43,21 +43,27 @@ class DataValidationTool:
             }
         
         issues = []
-        
+
+        # Parse the date column once; every check below (and the summary)
+        # reuses this series instead of re-running pd.to_datetime
+        dates = pd.to_datetime(df['date'], errors='coerce') if 'date' in df.columns else None
+        # One aggregation pass covers the summary's date range
+        date_stats = dates.agg(['min', 'max']) if dates is not None else None
+
         # Completeness checks
         completeness_score, completeness_issues = self._check_completeness(df)
         issues.extend(completeness_issues)
-        
+
         # Accuracy checks
-        accuracy_score, accuracy_issues = self._check_accuracy(df)
+        accuracy_score, accuracy_issues = self._check_accuracy(df, dates)
         issues.extend(accuracy_issues)
-        
+
         # Consistency checks
-        consistency_score, consistency_issues = self._check_consistency(df)
+        consistency_score, consistency_issues = self._check_consistency(df, dates)
         issues.extend(consistency_issues)
-        
+
         # Timeliness checks
-        timeliness_score, timeliness_issues = self._check_timeliness(df)
+        timeliness_score, timeliness_issues = self._check_timeliness(df, dates)
         issues.extend(timeliness_issues)
 
         # Anomaly detection (simple z-score on sales_value)
@@ -66,7 +72,18 @@ class DataValidationTool:
         
         # Calculate clean records
         clean_records = len(df) - len([i for i in issues if i['severity'] == 'high'])
-        
+
+        # One hash-group pass over the channel/department pair feeds both
+        # summary breakdowns instead of two independent value_counts scans
+        if 'channel' in df.columns and 'department' in df.columns:
+            pair_counts = df.groupby(['channel', 'department'], observed=True).size()
+            channel_counts = {k: int(v) for k, v in pair_counts.groupby(level=0, observed=True).sum().items()}
+            department_counts = {k: int(v) for k, v in pair_counts.groupby(level=1, observed=True).sum().items()}
+        else:
+            channel_counts = df['channel'].value_counts().to_dict() if 'channel' in df.columns else {}
+            department_counts = df['department'].value_counts().to_dict() if 'department' in df.columns else {}
+
+
         return {
             "total_records": len(df),
             "clean_records": clean_records,
@@ -78,20 +95,148 @@ class DataValidationTool:
             "overall_score": (completeness_score + accuracy_score + consistency_score + timeliness_score) / 4,
             "issues": issues,
             "date_range": {
-                "start": str(df['date'].min()) if 'date' in df.columns else None,
-                "end": str(df['date'].max()) if 'date' in df.columns else None
+                "start": str(date_stats['min'].date()) if date_stats is not None and pd.notna(date_stats['min']) else None,
+                "end": str(date_stats['max'].date()) if date_stats is not None and pd.notna(date_stats['max']) else None
             },
-            "channels": df['channel'].value_counts().to_dict() if 'channel' in df.columns else {},
-            "departments": df['department'].value_counts().to_dict() if 'department' in df.columns else {}
+            "channels": channel_counts,
+            "departments": department_counts
         }
     
+    def validate_in_db(self, conn, table_name: str = 'sales_aggregated') -> Dict:
+        """
+        Run the core quality checks as one SQL aggregate pass in DuckDB.
+
+        For data already persisted (post-load), this avoids pulling the
+        table back into pandas: a single SELECT with conditional aggregates
+        scans the columnar store once and the engine pushes the predicates
+        into the scan.
+
+        Args:
+            conn: DuckDB connection holding the table
+            table_name: Table to validate
+
+        Returns:
+            Dictionary with quality metrics and issues (same shape as
+            validate_data_quality, minus the pandas-only checks)
+        """
+        channels = ", ".join(f"'{c}'" for c in self.valid_channels)
+        row = conn.execute(f"""
+        SELECT
+            COUNT(*),
+            COUNT(*) - COUNT(date),
+            COUNT(*) - COUNT(channel),
+            COUNT(*) - COUNT(department),
+            COUNT(*) - COUNT(sales_value),
+            COUNT(*) - COUNT(margin_value),
+            COUNT(*) - COUNT(units),
+            SUM(CASE WHEN channel NOT IN ({channels}) THEN 1 ELSE 0 END),
+            SUM(CASE WHEN sales_value < 0 THEN 1 ELSE 0 END),
+            SUM(CASE WHEN units < 0 THEN 1 ELSE 0 END),
+            SUM(CASE WHEN discount_pct < 0 OR discount_pct > 100 THEN 1 ELSE 0 END),
+            SUM(CASE WHEN date > CURRENT_DATE THEN 1 ELSE 0 END),
+            MIN(date),
+            MAX(date)
+        FROM {table_name}
+        """).fetchone()
+
+        (total, date_null, channel_null, dept_null, sales_null, margin_null,
+         units_null, bad_channel, neg_sales, neg_units, bad_discount,
+         future_dates, date_min, date_max) = [x or 0 for x in row[:12]] + list(row[12:])
+
+        if total == 0:
+            return {
+                "total_records": 0,
+                "clean_records": 0,
+                "completeness": 0.0,
+                "accuracy": 0.0,
+                "consistency": 0.0,
+                "timeliness": 0.0,
+                "issues": []
+            }
+
+        issues = []
+        null_counts = {
+            'date': date_null, 'channel': channel_null, 'department': dept_null,
+            'sales_value': sales_null, 'margin_value': margin_null, 'units': units_null,
+        }
+        for col, count in null_counts.items():
+            if count > 0:
+                pct = count / total * 100
+                issues.append({
+                    "type": "missing_values",
+                    "severity": "high" if pct > 10 else "medium",
+                    "column": col,
+                    "count": int(count),
+                    "percentage": round(pct, 2),
+                    "message": f"Column '{col}' has {count} missing values ({pct:.1f}%)"
+                })
+
+        accuracy_score = 1.0
+        if bad_channel > 0:
+            issues.append({
+                "type": "invalid_channel",
+                "severity": "medium",
+                "column": "channel",
+                "count": int(bad_channel),
+                "message": f"Found {bad_channel} records with invalid channel values"
+            })
+            accuracy_score -= 0.1
+        for col, count in (('sales_value', neg_sales), ('units', neg_units)):
+            if count > 0:
+                issues.append({
+                    "type": "negative_values",
+                    "severity": "medium",
+                    "column": col,
+                    "count": int(count),
+                    "message": f"Column '{col}' has {count} negative values"
+                })
+                accuracy_score -= 0.1
+        if bad_discount > 0:
+            issues.append({
+                "type": "invalid_discount",
+                "severity": "medium",
+                "column": "discount_pct",
+                "count": int(bad_discount),
+                "message": f"Found {bad_discount} records with discount outside 0-100% range"
+            })
+            accuracy_score -= 0.1
+        if future_dates > 0:
+            issues.append({
+                "type": "future_dates",
+                "severity": "low",
+                "count": int(future_dates),
+                "message": f"Found {future_dates} records with future dates"
+            })
+
+        missing_cells = sum(null_counts.values())
+        completeness = 1.0 - missing_cells / (total * len(null_counts))
+        accuracy_score = max(0.0, accuracy_score)
+
+        return {
+            "total_records": int(total),
+            "clean_records": int(total) - len([i for i in issues if i['severity'] == 'high']),
+            "completeness": completeness,
+            "accuracy": accuracy_score,
+            "consistency": 1.0,
+            "timeliness": 1.0,
+            "overall_score": (completeness + accuracy_score + 2.0) / 4,
+            "issues": issues,
+            "date_range": {
+                "start": str(date_min) if date_min is not None else None,
+                "end": str(date_max) if date_max is not None else None
+            }
+        }
+
     def _check_completeness(self, df: pd.DataFrame) -> tuple:
         """Check for missing values."""
         issues = []
+        # One isna pass serves both the overall ratio and the per-column
+        # loop below, instead of re-scanning each required column
+        null_counts = df.isnull().sum()
         total_cells = len(df) * len(df.columns)
-        missing_cells = df.isnull().sum().sum()
+        missing_cells = int(null_counts.sum())
         completeness = 1.0 - (missing_cells / total_cells) if total_cells > 0 else 0.0
-        
+
         # Check required columns
         for col in self.required_columns:
             if col not in df.columns:
@@ -101,8 +246,8 @@ class DataValidationTool:
                     "column": col,
                     "message": f"Required column '{col}' is missing"
                 })
-            elif df[col].isnull().any():
-                missing_count = df[col].isnull().sum()
+            elif null_counts[col] > 0:
+                missing_count = null_counts[col]
                 missing_pct = (missing_count / len(df)) * 100
                 issues.append({
                     "type": "missing_values",
@@ -115,16 +260,15 @@ class DataValidationTool:
         
         return completeness, issues
     
-    def _check_accuracy(self, df: pd.DataFrame) -> tuple:
+    def _check_accuracy(self, df: pd.DataFrame, dates: Optional[pd.Series] = None) -> tuple:
         """Check data accuracy (valid ranges, types)."""
         issues = []
         accuracy_score = 1.0
-        
-        # Check date format
-        if 'date' in df.columns:
-            try:
-                pd.to_datetime(df['date'], errors='raise')
-            except:
+
+        # Check date format: coerced NaT on a non-null input means the
+        # value could not be parsed
+        if dates is not None:
+            if (dates.isna() & df['date'].notna()).any():
                 issues.append({
                     "type": "invalid_date_format",
                     "severity": "high",
@@ -133,51 +277,62 @@ class DataValidationTool:
                 })
                 accuracy_score -= 0.3
         
-        # Check channel values
+        # Check channel values: count on the mask and only pull the unique
+        # offenders when there are any, instead of materializing a filtered
+        # copy of the frame
         if 'channel' in df.columns:
-            invalid_channels = df[~df['channel'].isin(self.valid_channels)]
-            if len(invalid_channels) > 0:
+            invalid_mask = ~df['channel'].isin(self.valid_channels)
+            invalid_count = int(invalid_mask.sum())
+            if invalid_count > 0:
                 issues.append({
                     "type": "invalid_channel",
                     "severity": "medium",
                     "column": "channel",
-                    "count": len(invalid_channels),
-                    "invalid_values": invalid_channels['channel'].unique().tolist(),
-                    "message": f"Found {len(invalid_channels)} records with invalid channel values"
+                    "count": invalid_count,
+                    "invalid_values": df.loc[invalid_mask, 'channel'].unique().tolist(),
+                    "message": f"Found {invalid_count} records with invalid channel values"
                 })
                 accuracy_score -= 0.1
         
-        # Check numeric columns
-        numeric_cols = ['sales_value', 'margin_value', 'units']
-        for col in numeric_cols:
-            if col in df.columns:
+        # Check numeric columns in one matrix pass: negatives and 3-sigma
+        # outliers come from a single 2D scan instead of per-column filters
+        numeric_cols = [c for c in ('sales_value', 'margin_value', 'units') if c in df.columns]
+        if numeric_cols:
+            num = df[numeric_cols].to_numpy(dtype=np.float64)
+            neg_counts = (num < 0).sum(axis=0)
+
+            check_outliers = len(df) > 10  # Need enough data for outlier detection
+            if check_outliers:
+                # Robust median/MAD threshold: one deviation matrix serves
+                # both statistics, and extreme values no longer inflate the
+                # cutoff that is supposed to catch them
+                with np.errstate(invalid='ignore'):
+                    median = np.nanmedian(num, axis=0)
+                    deviations = np.abs(num - median)
+                    mad_scale = 1.4826 * np.nanmedian(deviations, axis=0)
+                    outlier_counts = (deviations > 3 * mad_scale).sum(axis=0)
+
+            for i, col in enumerate(numeric_cols):
                 # Check for negative values (except margin_value)
-                if col != 'margin_value':
-                    negative = df[df[col] < 0]
-                    if len(negative) > 0:
-                        issues.append({
-                            "type": "negative_values",
-                            "severity": "medium",
-                            "column": col,
-                            "count": len(negative),
-                            "message": f"Column '{col}' has {len(negative)} negative values"
-                        })
-                        accuracy_score -= 0.1
-                
-                # Check for outliers (values > 3 standard deviations)
-                if len(df) > 10:  # Need enough data for outlier detection
-                    mean = df[col].mean()
-                    std = df[col].std()
-                    if std > 0:
-                        outliers = df[abs(df[col] - mean) > 3 * std]
-                        if len(outliers) > 0:
-                            issues.append({
-                                "type": "outliers",
-                                "severity": "low",
-                                "column": col,
-                                "count": len(outliers),
-                                "message": f"Column '{col}' has {len(outliers)} potential outliers"
-                            })
+                if col != 'margin_value' and neg_counts[i] > 0:
+                    issues.append({
+                        "type": "negative_values",
+                        "severity": "medium",
+                        "column": col,
+                        "count": int(neg_counts[i]),
+                        "message": f"Column '{col}' has {neg_counts[i]} negative values"
+                    })
+                    accuracy_score -= 0.1
+
+                # Check for outliers (beyond 3 robust standard deviations)
+                if check_outliers and mad_scale[i] > 0 and outlier_counts[i] > 0:
+                    issues.append({
+                        "type": "outliers",
+                        "severity": "low",
+                        "column": col,
+                        "count": int(outlier_counts[i]),
+                        "message": f"Column '{col}' has {outlier_counts[i]} potential outliers"
+                    })
         
         # Check discount percentage
         if 'discount_pct' in df.columns:
@@ -195,70 +350,74 @@ class DataValidationTool:
         accuracy_score = max(0.0, accuracy_score)
         return accuracy_score, issues
     
-    def _check_consistency(self, df: pd.DataFrame) -> tuple:
+    def _check_consistency(self, df: pd.DataFrame, dates: Optional[pd.Series] = None) -> tuple:
         """Check data consistency."""
         issues = []
         consistency_score = 1.0
         
-        # Check margin calculation consistency
+        # Check margin calculation consistency on plain arrays; assigning a
+        # helper column here would mutate the caller's frame
         if 'sales_value' in df.columns and 'margin_value' in df.columns:
-            # Calculate expected margin percentage
-            df['calculated_margin_pct'] = (df['margin_value'] / df['sales_value'] * 100).where(df['sales_value'] > 0)
-            
+            s = df['sales_value'].to_numpy(dtype=np.float64)
+            m = df['margin_value'].to_numpy(dtype=np.float64)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                pct = np.where(s > 0, m / s * 100, np.nan)
+
             # Check for unrealistic margins (>50% or <0%)
-            unrealistic = df[(df['calculated_margin_pct'] > 50) | (df['calculated_margin_pct'] < 0)]
-            if len(unrealistic) > 0:
+            unrealistic = int(np.count_nonzero((pct > 50) | (pct < 0)))
+            if unrealistic > 0:
                 issues.append({
                     "type": "unrealistic_margin",
                     "severity": "medium",
-                    "count": len(unrealistic),
-                    "message": f"Found {len(unrealistic)} records with unrealistic margin percentages"
+                    "count": unrealistic,
+                    "message": f"Found {unrealistic} records with unrealistic margin percentages"
                 })
                 consistency_score -= 0.2
         
         # Check date consistency (no future dates)
-        if 'date' in df.columns:
-            today = datetime.now().date()
-            future_dates = df[pd.to_datetime(df['date']).dt.date > today]
-            if len(future_dates) > 0:
+        if dates is not None:
+            today = pd.Timestamp(datetime.now().date())
+            future_count = int((dates.dt.normalize() > today).sum())
+            if future_count > 0:
                 issues.append({
                     "type": "future_dates",
                     "severity": "low",
-                    "count": len(future_dates),
-                    "message": f"Found {len(future_dates)} records with future dates"
+                    "count": future_count,
+                    "message": f"Found {future_count} records with future dates"
                 })
         
         consistency_score = max(0.0, consistency_score)
         return consistency_score, issues
     
-    def _check_timeliness(self, df: pd.DataFrame) -> tuple:
+    def _check_timeliness(self, df: pd.DataFrame, dates: Optional[pd.Series] = None) -> tuple:
         """Check data timeliness."""
         issues = []
         timeliness_score = 1.0
-        
-        if 'date' in df.columns:
-            # Check for gaps in date sequence
-            dates = pd.to_datetime(df['date']).dt.date.unique()
-            dates_sorted = sorted(dates)
-            
-            if len(dates_sorted) > 1:
-                gaps = []
-                for i in range(len(dates_sorted) - 1):
-                    gap_days = (dates_sorted[i+1] - dates_sorted[i]).days
-                    if gap_days > 1:
-                        gaps.append({
-                            "start": str(dates_sorted[i]),
-                            "end": str(dates_sorted[i+1]),
-                            "gap_days": gap_days
-                        })
-                
-                if gaps:
+
+        if dates is not None:
+            # Check for gaps in date sequence: np.unique sorts, np.diff
+            # finds the day jumps in C instead of a Python pair loop
+            uniq = np.unique(dates.dropna().to_numpy().astype('datetime64[D]'))
+
+            if len(uniq) > 1:
+                diffs = np.diff(uniq).astype('int64')
+                gap_idx = np.where(diffs > 1)[0]
+
+                if len(gap_idx) > 0:
+                    gaps = [
+                        {
+                            "start": str(uniq[i]),
+                            "end": str(uniq[i + 1]),
+                            "gap_days": int(diffs[i])
+                        }
+                        for i in gap_idx[:10]  # Limit to first 10
+                    ]
                     issues.append({
                         "type": "date_gaps",
                         "severity": "low",
-                        "count": len(gaps),
-                        "gaps": gaps[:10],  # Limit to first 10
-                        "message": f"Found {len(gaps)} gaps in date sequence"
+                        "count": len(gap_idx),
+                        "gaps": gaps,
+                        "message": f"Found {len(gap_idx)} gaps in date sequence"
                     })
                     timeliness_score -= 0.1
         
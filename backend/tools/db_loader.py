@@ -4,6 +4,7 @@ Database Loader Tool for Data Analyst Agent
 Loads processed data into the database.
 """
 
+import io
 import pandas as pd
 from sqlalchemy import create_engine, text
 from sqlalchemy.exc import SQLAlchemyError
@@ -55,10 +56,12 @@ class DatabaseLoaderTool:
             table_name: Name of the table
         """
         if self.database_url.startswith('duckdb://'):
-            # DuckDB schema
+            # DuckDB schema; ids come from an explicit sequence since DuckDB
+            # has no serial type
+            self.engine.execute(f"CREATE SEQUENCE IF NOT EXISTS {table_name}_id_seq")
             create_sql = f"""
             CREATE TABLE IF NOT EXISTS {table_name} (
-                id BIGINT PRIMARY KEY,
+                id BIGINT PRIMARY KEY DEFAULT nextval('{table_name}_id_seq'),
                 date DATE NOT NULL,
                 channel VARCHAR(20) NOT NULL,
                 department VARCHAR(50) NOT NULL,
@@ -109,6 +112,35 @@ class DatabaseLoaderTool:
             logger.error(f"Failed to create table: {str(e)}")
             raise
     
+    def _copy_into(self, table_name: str, df: pd.DataFrame) -> Optional[int]:
+        """
+        Bulk-load a DataFrame via PostgreSQL COPY FROM STDIN.
+
+        Args:
+            table_name: Target table name
+            df: DataFrame whose columns match the target columns
+
+        Returns:
+            Number of rows copied, or None if the driver has no COPY support
+        """
+        raw = self.engine.raw_connection()
+        try:
+            cursor = raw.cursor()
+            if not hasattr(cursor, 'copy_expert'):
+                return None
+            buffer = io.StringIO()
+            df.to_csv(buffer, index=False, header=False)
+            buffer.seek(0)
+            columns = ", ".join(df.columns)
+            cursor.copy_expert(
+                f"COPY {table_name} ({columns}) FROM STDIN WITH (FORMAT CSV)",
+                buffer
+            )
+            raw.commit()
+            return cursor.rowcount if cursor.rowcount >= 0 else len(df)
+        finally:
+            raw.close()
+
     def load_dataframe(
         self,
         df: pd.DataFrame,
@@ -135,81 +167,107 @@ class DatabaseLoaderTool:
                 "rows_inserted": 0
             }
         
-        # Prepare DataFrame
-        df_load = df.copy()
-        
-        # Add promo_flag if discount_pct exists
+        # Select only the table's columns up front; the shallow copy shares
+        # the underlying column arrays instead of duplicating the frame
+        table_columns = ['date', 'channel', 'department', 'promo_flag', 'discount_pct',
+                        'sales_value', 'margin_value', 'units']
+        df_load = df[[col for col in table_columns if col in df.columns]].copy(deep=False)
+
+        # Add promo_flag if discount_pct exists; NaN compares False, so
+        # missing discounts are non-promo without an extra notna mask
         if 'discount_pct' in df_load.columns:
-            df_load['promo_flag'] = (df_load['discount_pct'] > 0) | (df_load['discount_pct'].notna())
+            df_load['promo_flag'] = df_load['discount_pct'] > 0
         elif 'promo_flag' not in df_load.columns:
             df_load['promo_flag'] = False
-        
-        # Calculate margin_pct
-        if 'sales_value' in df_load.columns and 'margin_value' in df_load.columns:
-            df_load['margin_pct'] = (df_load['margin_value'] / df_load['sales_value'] * 100).where(
-                df_load['sales_value'] > 0, 0
-            )
-        
+
         # Ensure required columns
         required_cols = ['date', 'channel', 'department', 'sales_value', 'margin_value', 'units']
         missing = [col for col in required_cols if col not in df_load.columns]
         if missing:
             raise ValueError(f"Missing required columns: {missing}")
-        
-        # Select only columns that exist in table
-        table_columns = ['date', 'channel', 'department', 'promo_flag', 'discount_pct',
-                        'sales_value', 'margin_value', 'units']
+
+        # Keep the table's column order for positional inserts
         df_load = df_load[[col for col in table_columns if col in df_load.columns]]
+
+        # Nullable Int64 keeps units integral even when NaNs are present
+        # (plain int64 would upcast to float64), matching the INTEGER column
+        if 'units' in df_load.columns and df_load['units'].dtype != 'Int64':
+            df_load['units'] = df_load['units'].round().astype('Int64')
         
         try:
             # Create table if not exists
             self.create_table_if_not_exists(table_name)
             
-            # Load data with optional upsert
-            rows_before = self._count_rows(table_name)
+            # Load data with optional upsert; each branch reports its own
+            # affected-row count, so no COUNT(*) round-trips are needed
+            rows_inserted = len(df_load)
 
             if upsert and conflict_keys:
+                conflict = ", ".join(conflict_keys)
                 if self.database_url.startswith('duckdb://'):
                     # DuckDB MERGE
                     self.engine.register('df_temp', df_load)
-                    conflict = ", ".join(conflict_keys)
                     assignments = ", ".join([f"{col}=excluded.{col}" for col in df_load.columns])
-                    merge_sql = f"""
-                    CREATE OR REPLACE TEMP TABLE tmp_load AS SELECT * FROM df_temp;
-                    INSERT INTO {table_name}
-                    SELECT * FROM tmp_load
-                    ON CONFLICT ({conflict}) DO UPDATE SET {assignments};
-                    """
-                    self.engine.execute(merge_sql)
+                    self.engine.execute("CREATE OR REPLACE TEMP TABLE tmp_load AS SELECT * FROM df_temp")
+                    columns = ", ".join(df_load.columns)
+                    merged = self.engine.execute(f"""
+                    INSERT INTO {table_name} ({columns})
+                    SELECT {columns} FROM tmp_load
+                    ON CONFLICT ({conflict}) DO UPDATE SET {assignments}
+                    RETURNING 1
+                    """).fetchall()
+                    rows_inserted = len(merged)
                 else:
-                    # PostgreSQL upsert via ON CONFLICT
+                    # PostgreSQL upsert via ON CONFLICT; xmax = 0 marks rows
+                    # that were newly inserted rather than updated
+                    tmp_table = f"{table_name}_tmp_load"
+                    columns = ", ".join(df_load.columns)
+
+                    # Stage rows through COPY rather than per-row to_sql
+                    # binding; the staging table clones the target's column
+                    # types so COPY text parses straight into them
+                    with self.engine.begin() as conn:
+                        conn.execute(text(f"DROP TABLE IF EXISTS {tmp_table}"))
+                        conn.execute(text(
+                            f"CREATE TABLE {tmp_table} AS SELECT {columns} FROM {table_name} WHERE false"
+                        ))
+                    if self._copy_into(tmp_table, df_load) is None:
+                        df_load.to_sql(tmp_table, self.engine, if_exists='append', index=False)
+
                     with self.engine.begin() as conn:
-                        tmp_table = f"{table_name}_tmp_load"
-                        df_load.to_sql(tmp_table, conn, if_exists='replace', index=False)
-                        conflict = ", ".join(conflict_keys)
-                        columns = ", ".join(df_load.columns)
                         assignments = ", ".join([f"{col}=EXCLUDED.{col}" for col in df_load.columns if col not in conflict_keys])
                         upsert_sql = f"""
-                        INSERT INTO {table_name} ({columns})
-                        SELECT {columns} FROM {tmp_table}
-                        ON CONFLICT ({conflict}) DO UPDATE SET {assignments};
-                        DROP TABLE {tmp_table};
+                        WITH ins AS (
+                            INSERT INTO {table_name} ({columns})
+                            SELECT {columns} FROM {tmp_table}
+                            ON CONFLICT ({conflict}) DO UPDATE SET {assignments}
+                            RETURNING (xmax = 0) AS inserted
+                        )
+                        SELECT COUNT(*) FILTER (WHERE inserted) FROM ins;
                         """
-                        conn.execute(text(upsert_sql))
+                        rows_inserted = conn.execute(text(upsert_sql)).scalar() or 0
+                        conn.execute(text(f"DROP TABLE {tmp_table}"))
             else:
                 if self.database_url.startswith('duckdb://'):
-                    self.engine.execute(f"INSERT INTO {table_name} SELECT * FROM df_load")
+                    # Appender writes the frame's column vectors straight
+                    # into storage, skipping SQL planning; by_name leaves
+                    # the id/timestamp defaults to fill themselves
+                    self.engine.append(table_name, df_load, by_name=True)
                 else:
-                    df_load.to_sql(
-                        table_name,
-                        self.engine,
-                        if_exists=if_exists,
-                        index=False,
-                        method='multi'
-                    )
-
-            rows_after = self._count_rows(table_name)
-            rows_inserted = max(rows_after - rows_before, 0)
+                    # COPY streams the rows instead of building multi-valued
+                    # INSERT text; fall back to to_sql for non-append modes
+                    # or drivers without copy support
+                    copied = self._copy_into(table_name, df_load) if if_exists == 'append' else None
+                    if copied is None:
+                        df_load.to_sql(
+                            table_name,
+                            self.engine,
+                            if_exists=if_exists,
+                            index=False,
+                            method='multi'
+                        )
+                    else:
+                        rows_inserted = copied
             
             logger.info(f"Loaded {rows_inserted} rows into {table_name}")
             
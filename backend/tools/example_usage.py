@@ -7,6 +7,7 @@ and load them into the database.
 
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Add parent directory to path
@@ -22,6 +23,49 @@ from tools import (
 )
 
 
+def _read_and_clean(file_path: str):
+    """
+    Read and clean a single file.
+
+    Top-level (picklable) so it can run in a worker process; the tools are
+    instantiated inside the worker and progress lines are returned rather
+    than printed to keep output ordered.
+
+    Returns:
+        Tuple of (file_path, cleaned DataFrame or None, log lines)
+    """
+    reader = XLSBReaderTool()
+    cleaner = DataCleaningTool()
+    log = [f"   📄 Reading: {file_path}"]
+
+    try:
+        # Inspect file first
+        metadata = reader.inspect_file(file_path)
+        log.append(f"      - Sheets: {metadata['sheets']}")
+        log.append(f"      - Columns: {len(metadata['columns'])}")
+        log.append(f"      - Rows: {metadata['row_count']}")
+        log.append(f"      - Size: {metadata['file_size_mb']} MB")
+
+        # Read file
+        df = reader.read_file(file_path)
+        log.append(f"      ✅ Loaded {len(df)} rows")
+    except Exception as e:
+        log.append(f"      ❌ Error: {str(e)}")
+        return file_path, None, log
+
+    if df is None or df.empty:
+        return file_path, None, log
+
+    log.append(f"   🧹 Cleaning: {os.path.basename(file_path)}")
+    try:
+        cleaned_df = cleaner.clean_dataframe(df)
+        log.append(f"      ✅ Cleaned: {len(cleaned_df)} rows")
+        return file_path, cleaned_df, log
+    except Exception as e:
+        log.append(f"      ❌ Error: {str(e)}")
+        return file_path, None, log
+
+
 def process_data_files(
     file_paths: list,
     database_url: str,
@@ -39,49 +83,28 @@ def process_data_files(
     print("Data Analyst Agent - Processing Files")
     print("=" * 60)
     
-    # Step 1: Read XLSB files
+    # Steps 1-2: Read and clean files in parallel. XLSB decoding is
+    # CPU-bound and independent per file, so worker processes scale with
+    # core count; only the merge below is sequential. Raw frames live and
+    # die inside the workers
     print("\n1. Reading XLSB files...")
-    reader = XLSBReaderTool()
-    dataframes = {}
-    
+    print("\n2. Cleaning data...")
+    cleaned_dataframes = {}
+
+    existing_paths = []
     for file_path in file_paths:
         if not os.path.exists(file_path):
             print(f"   ⚠️  File not found: {file_path}")
-            continue
-        
-        print(f"   📄 Reading: {file_path}")
-        try:
-            # Inspect file first
-            metadata = reader.inspect_file(file_path)
-            print(f"      - Sheets: {metadata['sheets']}")
-            print(f"      - Columns: {len(metadata['columns'])}")
-            print(f"      - Rows: {metadata['row_count']}")
-            print(f"      - Size: {metadata['file_size_mb']} MB")
-            
-            # Read file
-            df = reader.read_file(file_path)
-            dataframes[file_path] = df
-            print(f"      ✅ Loaded {len(df)} rows")
-        except Exception as e:
-            print(f"      ❌ Error: {str(e)}")
-            dataframes[file_path] = None
-    
-    # Step 2: Clean data
-    print("\n2. Cleaning data...")
-    cleaner = DataCleaningTool()
-    cleaned_dataframes = {}
-    
-    for file_path, df in dataframes.items():
-        if df is None or df.empty:
-            continue
-        
-        print(f"   🧹 Cleaning: {os.path.basename(file_path)}")
-        try:
-            cleaned_df = cleaner.clean_dataframe(df)
-            cleaned_dataframes[file_path] = cleaned_df
-            print(f"      ✅ Cleaned: {len(cleaned_df)} rows")
-        except Exception as e:
-            print(f"      ❌ Error: {str(e)}")
+        else:
+            existing_paths.append(file_path)
+
+    if existing_paths:
+        max_workers = min(len(existing_paths), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for file_path, cleaned_df, log in executor.map(_read_and_clean, existing_paths):
+                print("\n".join(log))
+                if cleaned_df is not None:
+                    cleaned_dataframes[file_path] = cleaned_df
     
     # Step 3: Detect overlaps
     print("\n3. Detecting overlaps...")
@@ -6,6 +6,7 @@ Supports reading from XLSB files and database.
 """
 
 from typing import List, Optional, Dict, Any
+import numpy as np
 import pandas as pd
 from pathlib import Path
 import logging
@@ -15,7 +16,11 @@ logger = logging.getLogger(__name__)
 
 class PromoCampaign:
     """Promotional campaign data structure."""
-    
+
+    # Slots drop the per-instance __dict__; catalogs hold thousands of these
+    __slots__ = ('id', 'promo_name', 'date_start', 'date_end',
+                 'departments', 'channels', 'avg_discount_pct', 'mechanics')
+
     def __init__(self, data: Dict):
         self.id = data.get('id')
         self.promo_name = data.get('promo_name')
@@ -54,6 +59,8 @@ class PromoCatalogTool:
         self.db_connection = db_connection
         self.xlsb_reader = xlsb_reader
         self._promo_cache = None
+        self._bounds_cache = None
+        self._id_index: Dict[str, PromoCampaign] = {}
     
     def load_from_xlsb(self, file_path: str) -> pd.DataFrame:
         """
@@ -98,39 +105,38 @@ class PromoCatalogTool:
         # Option 1: If there's a promo_name or campaign column
         if 'promo_name' in df.columns or 'campaign' in df.columns:
             promo_col = 'promo_name' if 'promo_name' in df.columns else 'campaign'
-            grouped = df.groupby(promo_col)
-            
-            for promo_name, group in grouped:
-                # Get date range
-                if 'date' in group.columns:
-                    date_start = pd.to_datetime(group['date']).min().date()
-                    date_end = pd.to_datetime(group['date']).max().date()
-                else:
-                    date_start = None
-                    date_end = None
-                
-                # Get departments
-                departments = []
-                if 'department' in group.columns:
-                    departments = group['department'].unique().tolist()
-                
-                # Get channels
-                channels = []
-                if 'channel' in group.columns:
-                    channels = group['channel'].unique().tolist()
-                
-                # Get average discount
-                avg_discount = None
-                if 'discount_pct' in group.columns:
-                    avg_discount = group['discount_pct'].mean()
-                
+
+            # One named-agg pass computes every per-campaign field instead
+            # of four scans per group; dates are parsed once up front
+            spec = {}
+            if 'date' in df.columns:
+                df = df.assign(date=pd.to_datetime(df['date']))
+                spec['date_start'] = ('date', 'min')
+                spec['date_end'] = ('date', 'max')
+            if 'department' in df.columns:
+                spec['departments'] = ('department', 'unique')
+            if 'channel' in df.columns:
+                spec['channels'] = ('channel', 'unique')
+            if 'discount_pct' in df.columns:
+                spec['avg_discount_pct'] = ('discount_pct', 'mean')
+
+            if spec:
+                agg = df.groupby(promo_col).agg(**spec)
+            else:
+                agg = df.groupby(promo_col).size().to_frame('size').drop(columns='size')
+
+            for row in agg.itertuples():
+                date_start = row.date_start.date() if 'date_start' in spec and pd.notna(row.date_start) else None
+                date_end = row.date_end.date() if 'date_end' in spec and pd.notna(row.date_end) else None
+                avg_discount = row.avg_discount_pct if 'avg_discount_pct' in spec else None
+
                 campaign = PromoCampaign({
-                    'id': f"promo_{promo_name}_{date_start}",
-                    'promo_name': promo_name,
+                    'id': f"promo_{row.Index}_{date_start}",
+                    'promo_name': row.Index,
                     'date_start': str(date_start) if date_start else None,
                     'date_end': str(date_end) if date_end else None,
-                    'departments': departments,
-                    'channels': channels,
+                    'departments': row.departments.tolist() if 'departments' in spec else [],
+                    'channels': row.channels.tolist() if 'channels' in spec else [],
                     'avg_discount_pct': float(avg_discount) if avg_discount else None,
                     'mechanics': {}
                 })
@@ -138,63 +144,39 @@ class PromoCatalogTool:
         
         # Option 2: Group by date ranges with discounts
         elif 'date' in df.columns and 'discount_pct' in df.columns:
-            # Group consecutive days with discounts as campaigns
-            df_sorted = df.sort_values('date')
-            df_sorted['date'] = pd.to_datetime(df_sorted['date'])
-            df_sorted['has_discount'] = df_sorted['discount_pct'] > 0
-            
-            # Find promo periods (consecutive days with discounts)
-            promo_periods = []
-            current_period = None
-            
-            for idx, row in df_sorted.iterrows():
-                if row['has_discount']:
-                    if current_period is None:
-                        current_period = {
-                            'start': row['date'],
-                            'end': row['date'],
-                            'rows': [row]
-                        }
-                    else:
-                        # Check if consecutive day
-                        if (row['date'] - current_period['end']).days <= 1:
-                            current_period['end'] = row['date']
-                            current_period['rows'].append(row)
-                        else:
-                            # Save current period and start new one
-                            promo_periods.append(current_period)
-                            current_period = {
-                                'start': row['date'],
-                                'end': row['date'],
-                                'rows': [row]
-                            }
-                else:
-                    if current_period is not None:
-                        promo_periods.append(current_period)
-                        current_period = None
-            
-            if current_period is not None:
-                promo_periods.append(current_period)
-            
+            # Group consecutive days with discounts as campaigns via
+            # run-length encoding: a promo row opens a new period when the
+            # previous row was not a promo or the date jumped by more than
+            # one day, so cumsum over those breaks labels each run — no
+            # Python-level row iteration
+            df_sorted = df.assign(date=pd.to_datetime(df['date'])).sort_values('date')
+            has_discount = df_sorted['discount_pct'] > 0
+            day_gap = df_sorted['date'].diff().dt.days.fillna(1).gt(1)
+            new_period = has_discount & (day_gap | ~has_discount.shift(fill_value=False))
+            period_id = new_period.cumsum()
+
+            promo_rows = df_sorted[has_discount]
+            grouped = promo_rows.groupby(period_id[has_discount])
+
             # Create campaigns from periods
-            for i, period in enumerate(promo_periods):
-                period_df = pd.DataFrame(period['rows'])
-                
+            for i, (_, period_df) in enumerate(grouped, start=1):
                 departments = []
                 if 'department' in period_df.columns:
                     departments = period_df['department'].unique().tolist()
-                
+
                 channels = []
                 if 'channel' in period_df.columns:
                     channels = period_df['channel'].unique().tolist()
-                
-                avg_discount = period_df['discount_pct'].mean() if 'discount_pct' in period_df.columns else None
-                
+
+                avg_discount = period_df['discount_pct'].mean()
+                start = period_df['date'].iloc[0]
+                end = period_df['date'].iloc[-1]
+
                 campaign = PromoCampaign({
-                    'id': f"promo_period_{i+1}_{period['start'].date()}",
-                    'promo_name': f"Promo Period {i+1}",
-                    'date_start': str(period['start'].date()),
-                    'date_end': str(period['end'].date()),
+                    'id': f"promo_period_{i}_{start.date()}",
+                    'promo_name': f"Promo Period {i}",
+                    'date_start': str(start.date()),
+                    'date_end': str(end.date()),
                     'departments': departments,
                     'channels': channels,
                     'avg_discount_pct': float(avg_discount) if avg_discount else None,
@@ -252,6 +234,18 @@ class PromoCatalogTool:
         logger.warning("Database loading not yet implemented")
         return []
     
+    def _campaign_bounds(self, campaigns: List[PromoCampaign]) -> tuple:
+        """Start/end dates as datetime64 arrays, reused for the cached list."""
+        if campaigns is self._promo_cache and self._bounds_cache is not None:
+            return self._bounds_cache
+        bounds = (
+            np.array([c.date_start or 'NaT' for c in campaigns], dtype='datetime64[D]'),
+            np.array([c.date_end or 'NaT' for c in campaigns], dtype='datetime64[D]'),
+        )
+        if campaigns is self._promo_cache:
+            self._bounds_cache = bounds
+        return bounds
+
     def _apply_filters(
         self,
         campaigns: List[PromoCampaign],
@@ -259,23 +253,33 @@ class PromoCatalogTool:
     ) -> List[PromoCampaign]:
         """Apply filters to campaigns."""
         filtered = campaigns
+
+        if filtered and ('date_start' in filters or 'date_end' in filters):
+            # Parse all campaign bounds into one datetime64 array per side
+            # instead of calling pd.to_datetime per campaign per filter;
+            # missing bounds become NaT, which compares False and so drops
+            # the campaign just like the old per-item guard
+            bounds = self._campaign_bounds(filtered)
+            keep = np.ones(len(filtered), dtype=bool)
+            if 'date_start' in filters:
+                keep &= bounds[0] >= np.datetime64(pd.to_datetime(filters['date_start']).date())
+            if 'date_end' in filters:
+                keep &= bounds[1] <= np.datetime64(pd.to_datetime(filters['date_end']).date())
+            filtered = [filtered[i] for i in np.flatnonzero(keep)]
         
-        if 'date_start' in filters:
-            date_start = pd.to_datetime(filters['date_start']).date()
-            filtered = [c for c in filtered if c.date_start and pd.to_datetime(c.date_start).date() >= date_start]
-        
-        if 'date_end' in filters:
-            date_end = pd.to_datetime(filters['date_end']).date()
-            filtered = [c for c in filtered if c.date_end and pd.to_datetime(c.date_end).date() <= date_end]
-        
-        if 'channel' in filters:
-            channel = filters['channel']
-            filtered = [c for c in filtered if channel in c.channels or not c.channels]
-        
-        if 'department' in filters:
-            department = filters['department']
-            filtered = [c for c in filtered if department in c.departments or not c.departments]
-        
+        # One pass handles both membership filters instead of building an
+        # intermediate list per key
+        has_channel = 'channel' in filters
+        has_department = 'department' in filters
+        if has_channel or has_department:
+            channel = filters.get('channel')
+            department = filters.get('department')
+            filtered = [
+                c for c in filtered
+                if (not has_channel or channel in c.channels or not c.channels)
+                and (not has_department or department in c.departments or not c.departments)
+            ]
+
         return filtered
     
     def get_promo_by_id(
@@ -293,16 +297,15 @@ class PromoCatalogTool:
         """
         # Load all campaigns if not cached
         if self._promo_cache is None:
-            self._promo_cache = self.get_past_promos()
-        
-        for campaign in self._promo_cache:
-            if campaign.id == promo_id:
-                return campaign
-        
-        return None
-    
+            self.cache_promos(self.get_past_promos())
+
+        return self._id_index.get(promo_id)
+
     def cache_promos(self, campaigns: List[PromoCampaign]):
         """Cache promotional campaigns."""
         self._promo_cache = campaigns
+        self._bounds_cache = None
+        # O(1) id lookups instead of a linear scan per get_promo_by_id
+        self._id_index = {c.id: c for c in campaigns}
 
 
@@ -5,9 +5,11 @@ Specialized processor for promotional catalog XLSB files.
 Extends Data Analyst Agent capabilities for promo-specific data.
 """
 
+import os
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
 
 from .xlsb_reader import XLSBReaderTool
@@ -19,6 +21,57 @@ from .promo_catalog_tool import PromoCatalogTool, PromoCampaign
 logger = logging.getLogger(__name__)
 
 
+def _extract_promo_file(file_path: str) -> Tuple[Dict, Optional[pd.DataFrame]]:
+    """
+    Read, clean, validate and extract campaigns for one promo file.
+
+    Top-level (picklable) so multiple files can run in worker processes;
+    the database write stays with the caller, so workers hold no
+    connections.
+
+    Returns:
+        Tuple of (results dict, cleaned DataFrame or None on failure)
+    """
+    reader = XLSBReaderTool()
+    catalog = PromoCatalogTool(xlsb_reader=reader)
+
+    results = {
+        "file_path": file_path,
+        "success": False,
+        "campaigns_extracted": 0,
+        "records_processed": 0,
+        "quality_report": None,
+        "errors": []
+    }
+
+    try:
+        # Step 1: Read XLSB file
+        logger.info("Reading XLSB file...")
+        df = reader.read_file(file_path)
+        results["records_processed"] = len(df)
+
+        # Step 2: Clean data
+        logger.info("Cleaning data...")
+        df_clean = DataCleaningTool().clean_dataframe(df)
+
+        # Step 3: Validate quality
+        logger.info("Validating data quality...")
+        results["quality_report"] = DataValidationTool().validate_data_quality(df_clean)
+
+        # Step 4: Extract promotional campaigns
+        logger.info("Extracting promotional campaigns...")
+        campaigns = catalog.process_promo_dataframe(df_clean)
+        results["campaigns_extracted"] = len(campaigns)
+        results["campaigns"] = [c.to_dict() for c in campaigns]
+        results["success"] = True
+        return results, df_clean
+
+    except Exception as e:
+        logger.error(f"Error processing promo file: {str(e)}")
+        results["errors"].append(str(e))
+        return results, None
+
+
 class PromoProcessor:
     """Processor for promotional catalog XLSB files."""
     
@@ -52,61 +105,27 @@ class PromoProcessor:
             Dictionary with processing results
         """
         logger.info(f"Processing promo file: {file_path}")
-        
-        results = {
-            "file_path": file_path,
-            "success": False,
-            "campaigns_extracted": 0,
-            "records_processed": 0,
-            "quality_report": None,
-            "errors": []
-        }
-        
-        try:
-            # Step 1: Read XLSB file
-            logger.info("Reading XLSB file...")
-            df = self.xlsb_reader.read_file(file_path)
-            results["records_processed"] = len(df)
-            
-            # Step 2: Clean data
-            logger.info("Cleaning data...")
-            df_clean = self.data_cleaner.clean_dataframe(df)
-            
-            # Step 3: Validate quality
-            logger.info("Validating data quality...")
-            quality_report = self.data_validator.validate_data_quality(df_clean)
-            results["quality_report"] = quality_report
-            
-            # Step 4: Extract promotional campaigns
-            logger.info("Extracting promotional campaigns...")
-            campaigns = self.promo_catalog.process_promo_dataframe(df_clean)
-            results["campaigns_extracted"] = len(campaigns)
-            
-            # Step 5: Load to database if requested
-            if load_to_db:
-                logger.info("Loading to database...")
-                # Load promo data to promo_catalog table
-                # Note: This might need special handling depending on schema
-                # For now, we'll store the cleaned data
-                db_result = self.db_loader.load_dataframe(
-                    df_clean,
-                    table_name='promo_catalog',
-                    if_exists='append'
-                )
-                results["db_result"] = db_result
-            
-            results["success"] = True
-            results["campaigns"] = [c.to_dict() for c in campaigns]
-            
-            logger.info(f"Successfully processed promo file: {len(campaigns)} campaigns extracted")
-            
-        except Exception as e:
-            logger.error(f"Error processing promo file: {str(e)}")
-            results["errors"].append(str(e))
-            results["success"] = False
-        
+
+        results, df_clean = _extract_promo_file(file_path)
+
+        # Step 5: Load to database if requested
+        if results["success"] and load_to_db:
+            logger.info("Loading to database...")
+            # Load promo data to promo_catalog table
+            # Note: This might need special handling depending on schema
+            # For now, we'll store the cleaned data
+            results["db_result"] = self.db_loader.load_dataframe(
+                df_clean,
+                table_name='promo_catalog',
+                if_exists='append'
+            )
+
+        if results["success"]:
+            logger.info(
+                f"Successfully processed promo file: {results['campaigns_extracted']} campaigns extracted"
+            )
         return results
-    
+
     def process_multiple_promo_files(
         self,
         file_paths: List[str],
@@ -114,11 +133,15 @@ class PromoProcessor:
     ) -> Dict:
         """
         Process multiple promotional catalog files.
-        
+
+        Files are read, cleaned, validated and campaign-extracted in
+        parallel worker processes (XLSB parsing is the CPU-bound step);
+        database writes happen sequentially in this process afterwards.
+
         Args:
             file_paths: List of file paths
             load_to_db: Whether to load to database
-            
+
         Returns:
             Dictionary with results for each file
         """
@@ -127,14 +150,24 @@ class PromoProcessor:
             "total_campaigns": 0,
             "file_results": []
         }
-        
-        for file_path in file_paths:
-            file_result = self.process_promo_file(file_path, load_to_db)
-            results["file_results"].append(file_result)
-            
-            if file_result["success"]:
-                results["files_processed"] += 1
-                results["total_campaigns"] += file_result["campaigns_extracted"]
-        
+
+        if not file_paths:
+            return results
+
+        max_workers = min(len(file_paths), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for file_result, df_clean in executor.map(_extract_promo_file, file_paths):
+                if file_result["success"] and load_to_db:
+                    file_result["db_result"] = self.db_loader.load_dataframe(
+                        df_clean,
+                        table_name='promo_catalog',
+                        if_exists='append'
+                    )
+                results["file_results"].append(file_result)
+
+                if file_result["success"]:
+                    results["files_processed"] += 1
+                    results["total_campaigns"] += file_result["campaigns_extracted"]
+
         return results
 
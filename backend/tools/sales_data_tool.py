@@ -23,9 +23,18 @@ from pandas import DataFrame
 from models.schemas import DateRange
 
 
+@lru_cache(maxsize=256)
+def _range_bounds(start_date: date, end_date: date) -> Tuple[int, int]:
+    """int64 ns bounds for a date range, memoized across repeated queries."""
+    return pd.Timestamp(start_date).value, pd.Timestamp(end_date).value
+
+
 class SalesDataTool:
     """Tool for accessing historical sales data."""
-    
+
+    # Grain dimensions that may be interpolated into SQL identifiers
+    _GRAIN_COLUMNS = frozenset({'date', 'channel', 'department', 'promo_flag'})
+
     def __init__(self, db_connection=None, data_path: Optional[str] = None, database_url: Optional[str] = None):
         """
         Initialize Sales Data Tool.
@@ -41,28 +50,99 @@ class SalesDataTool:
         self.data_path = Path(data_path) if data_path else default_path
         if not self.database_url and not self.data_path.exists():
             raise FileNotFoundError(f"Sample sales data not found at {self.data_path}")
+        # Loaded frame and DB handle are reused across calls; every filter
+        # and aggregation otherwise re-reads the full source
+        self._df_cache: Optional[DataFrame] = None
+        self._df_mtime: Optional[float] = None
+        self._date_i8: Optional[np.ndarray] = None
+        self._value_index: dict = {}
+        self._db_engine = None
+        # Aggregation results keyed by (range, grain, filters); agents tend
+        # to repeat the same query several times per session
+        self._agg_cache: dict = {}
+
+    def invalidate_cache(self) -> None:
+        """Drop the cached frame so the next read reloads from the source."""
+        self._df_cache = None
+        self._df_mtime = None
+        self._date_i8 = None
+        self._value_index = {}
+        self._agg_cache.clear()
+
+    def _cache_frame(self, df: DataFrame) -> DataFrame:
+        """Sort by date and cache the frame plus its int64 date view."""
+        self._agg_cache.clear()
+        if df["date"].dtype != "datetime64[ns]":
+            df = df.assign(date=pd.to_datetime(df["date"]))
+        df = df.sort_values("date", kind="stable", ignore_index=True)
+        self._df_cache = df
+        # Monotonic dates let the range filter binary-search instead of
+        # masking the whole column
+        self._date_i8 = df["date"].to_numpy().view("i8")
+        # Precompute per-value row indexes for the categorical columns so
+        # equality filters become dict lookups instead of column scans
+        self._value_index = {}
+        for col in ("channel", "department", "promo_flag"):
+            if col in df.columns and isinstance(df[col].dtype, pd.CategoricalDtype):
+                codes = df[col].cat.codes.to_numpy()
+                self._value_index[col] = {
+                    value: np.flatnonzero(codes == code)
+                    for code, value in enumerate(df[col].cat.categories)
+                }
+        return df
+
+    @staticmethod
+    def _normalize_categories(series: pd.Series, norm) -> pd.Categorical:
+        """Apply a normalizer per category; safe even if values collide."""
+        cat = series.astype("category")
+        mapped = pd.Index([norm(c) for c in cat.cat.categories])
+        return pd.Categorical(mapped.take(cat.cat.codes))
 
     def _load_dataframe(self) -> DataFrame:
-        """Load sales data from database or CSV."""
+        """Load sales data from database or CSV (cached after first load)."""
+        if self._df_cache is not None:
+            # CSV-backed caches are keyed on the file's mtime so an updated
+            # sample file is picked up without a manual invalidate
+            if self._df_mtime is None or (
+                self.data_path.exists()
+                and self.data_path.stat().st_mtime == self._df_mtime
+            ):
+                return self._df_cache
+
         # Try database first if configured
         if self.database_url:
             try:
-                return self._load_from_database()
+                return self._cache_frame(self._load_from_database())
             except Exception:
                 # Fall back to CSV if database fails
                 pass
-        
-        # Load from CSV
+
+        # Load from CSV; the string columns arrive dictionary-encoded
+        # (category) so normalization below touches each unique value once,
+        # not each row, and the frame stores int codes instead of objects
         if self.data_path.exists():
-            df = pd.read_csv(self.data_path, parse_dates=["date"])
-            df["channel"] = df["channel"].str.lower()
-            df["department"] = df["department"].str.upper()
-            df["promo_flag"] = df["promo_flag"].astype(str)
+            self._df_mtime = self.data_path.stat().st_mtime
+            # Parse only the columns the tool serves, with float32 measures:
+            # half the memory and twice the SIMD lanes for the groupby sums
+            df = pd.read_csv(
+                self.data_path,
+                usecols=["date", "channel", "department", "promo_flag",
+                         "discount_pct", "sales_value", "margin_value", "units"],
+                parse_dates=["date"],
+                dtype={
+                    "channel": "category", "department": "category", "promo_flag": "category",
+                    "discount_pct": "float32", "sales_value": "float32",
+                    "margin_value": "float32", "units": "float32",
+                },
+            )
+            df["channel"] = self._normalize_categories(df["channel"], str.lower)
+            df["department"] = self._normalize_categories(df["department"], str.upper)
+            df["promo_flag"] = self._normalize_categories(df["promo_flag"], str)
             if not df.empty:
-                return df
-        
+                return self._cache_frame(df)
+
         # As a last resort, synthesize a deterministic 90-day demo dataset
-        return self._generate_synthetic_dataframe()
+        return self._cache_frame(self._generate_synthetic_dataframe())
     
     def _load_from_database(self) -> DataFrame:
         """Load sales data from database."""
@@ -73,48 +153,123 @@ class SalesDataTool:
         if not database_url:
             raise ValueError("No database URL configured")
         
+        # Keep the connection/engine across calls instead of re-opening per
+        # query
         if database_url.startswith('duckdb://'):
-            import duckdb
-            db_path = database_url.replace('duckdb://', '')
-            conn = duckdb.connect(db_path)
-            df = conn.execute("SELECT * FROM sales_aggregated").df()
-            conn.close()
+            if self._db_engine is None:
+                import duckdb
+                db_path = database_url.replace('duckdb://', '')
+                self._db_engine = duckdb.connect(db_path)
+            df = self._db_engine.execute("SELECT * FROM sales_aggregated").df()
         else:
-            engine = create_engine(database_url)
-            with engine.connect() as conn:
+            if self._db_engine is None:
+                self._db_engine = create_engine(database_url)
+            with self._db_engine.connect() as conn:
                 df = pd.read_sql(text("SELECT * FROM sales_aggregated"), conn)
         
-        # Standardize columns
+        # Standardize columns; the string columns become dictionary-encoded
+        # with normalization applied per unique value, as in the CSV path
         if "date" in df.columns:
             df["date"] = pd.to_datetime(df["date"])
         if "channel" in df.columns:
-            df["channel"] = df["channel"].str.lower()
+            df["channel"] = self._normalize_categories(df["channel"], str.lower)
         if "department" in df.columns:
-            df["department"] = df["department"].str.upper()
+            df["department"] = self._normalize_categories(df["department"], str.upper)
         if "promo_flag" in df.columns:
-            df["promo_flag"] = df["promo_flag"].astype(str)
-        
+            df["promo_flag"] = self._normalize_categories(df["promo_flag"], str)
+        # Measures come back float64 from the driver; float32 matches the
+        # CSV path and halves the cached frame's numeric footprint
+        for col in ("discount_pct", "sales_value", "margin_value", "units"):
+            if col in df.columns:
+                df[col] = df[col].astype("float32")
+
         return df
 
-    def _filter_dataframe(
+    def _aggregate_in_db(
         self,
         date_range: Tuple[date, date],
+        grain: List[str],
         filters: Optional[dict] = None
     ) -> DataFrame:
-        """Filter the cached dataframe by date range and optional filters."""
-        df = self._load_dataframe()
-        start_date, end_date = date_range
-        mask = (df["date"] >= pd.to_datetime(start_date)) & (df["date"] <= pd.to_datetime(end_date))
-        filtered = df.loc[mask].copy()
+        """Run filter + GROUP BY inside DuckDB and fetch only the result."""
+        if self._db_engine is None:
+            import duckdb
+            db_path = self.database_url.replace('duckdb://', '')
+            self._db_engine = duckdb.connect(db_path)
 
+        where = ["date BETWEEN ? AND ?"]
+        params: list = [date_range[0], date_range[1]]
         if filters:
             if channel := filters.get("channel"):
-                filtered = filtered[filtered["channel"] == channel.lower()]
+                where.append("lower(channel) = ?")
+                params.append(channel.lower())
             if department := filters.get("department"):
-                filtered = filtered[filtered["department"] == department.upper()]
+                where.append("upper(department) = ?")
+                params.append(department.upper())
             if promo_flag := filters.get("promo_flag"):
-                filtered = filtered[filtered["promo_flag"] == str(promo_flag)]
-        return filtered
+                where.append("promo_flag = ?")
+                params.append(str(promo_flag).lower() in ('true', '1'))
+
+        cols = ", ".join(grain)
+        sql = f"""
+        SELECT {cols},
+               SUM(sales_value) AS sales_value,
+               SUM(margin_value) AS margin_value,
+               SUM(units) AS units,
+               AVG(discount_pct) AS discount_pct
+        FROM sales_aggregated
+        WHERE {' AND '.join(where)}
+        GROUP BY {cols}
+        """
+        return self._db_engine.execute(sql, params).df()
+
+    def _filter_dataframe(
+        self,
+        date_range: Tuple[date, date],
+        filters: Optional[dict] = None
+    ) -> DataFrame:
+        """Filter the cached dataframe by date range and optional filters."""
+        df = self._load_dataframe()
+        start_date, end_date = date_range
+
+        # The cached frame is date-sorted, so the range reduces to a binary
+        # search over the int64 ns view and a contiguous slice — no
+        # full-column mask for the date bounds
+        start_ns, end_ns = _range_bounds(start_date, end_date)
+        lo = int(np.searchsorted(self._date_i8, start_ns, side="left"))
+        hi = int(np.searchsorted(self._date_i8, end_ns, side="right"))
+        sub = df.iloc[lo:hi]
+
+        if not filters:
+            return sub
+
+        # Equality filters resolve to the precomputed per-value row indexes;
+        # each sorted index array is cut to the date slice by bisection and
+        # the survivors intersected, so no column is scanned here
+        wanted = []
+        if channel := filters.get("channel"):
+            wanted.append(("channel", channel.lower()))
+        if department := filters.get("department"):
+            wanted.append(("department", department.upper()))
+        if promo_flag := filters.get("promo_flag"):
+            wanted.append(("promo_flag", str(promo_flag)))
+        if not wanted:
+            return sub
+
+        idx: Optional[np.ndarray] = None
+        for col, value in wanted:
+            col_index = self._value_index.get(col)
+            if col_index is not None:
+                rows = col_index.get(value, np.empty(0, dtype=np.intp))
+                rows = rows[np.searchsorted(rows, lo):np.searchsorted(rows, hi)]
+            else:
+                # Column was not dictionary-encoded; mask the slice instead
+                rows = np.flatnonzero((sub[col] == value).to_numpy()) + lo
+            idx = rows if idx is None else np.intersect1d(idx, rows, assume_unique=True)
+            if idx.size == 0:
+                break
+
+        return df.take(idx)
     
     def get_aggregated_sales(
         self,
@@ -136,9 +291,30 @@ class SalesDataTool:
         if not grain:
             raise ValueError("At least one grain dimension is required")
 
+        # With a DuckDB backend, push the filter and GROUP BY into the
+        # engine so only the aggregated rows cross into pandas
+        if (
+            self.database_url
+            and self.database_url.startswith('duckdb://')
+            and set(grain) <= self._GRAIN_COLUMNS
+        ):
+            try:
+                return self._aggregate_in_db(date_range, grain, filters)
+            except Exception:
+                # Fall back to the pandas path if the table is unavailable
+                pass
+
+        cache_key = (
+            date_range[0], date_range[1], tuple(grain),
+            tuple(sorted(filters.items())) if filters else (),
+        )
+        cached = self._agg_cache.get(cache_key)
+        if cached is not None:
+            return cached.copy()
+
         df = self._filter_dataframe(date_range, filters)
         agg_df = (
-            df.groupby(grain, dropna=False)
+            df.groupby(grain, dropna=False, observed=True)
             .agg(
                 sales_value=("sales_value", "sum"),
                 margin_value=("margin_value", "sum"),
@@ -147,7 +323,8 @@ class SalesDataTool:
             )
             .reset_index()
         )
-        return agg_df
+        self._agg_cache[cache_key] = agg_df
+        return agg_df.copy()
     
     def get_daily_sales(
         self,
@@ -172,7 +349,7 @@ class SalesDataTool:
         }
         df = self._filter_dataframe(date_range, filters)
         daily_df = (
-            df.groupby("date")
+            df.groupby("date", observed=True)
             .agg(
                 sales_value=("sales_value", "sum"),
                 margin_value=("margin_value", "sum"),
@@ -187,48 +364,58 @@ class SalesDataTool:
         Build a deterministic 90-day demo dataset so API responses are stable.
 
         The generator avoids randomness by using a fixed seed and simple formulas
-        across three departments and two channels.
+        across three departments and two channels. The output is fully
+        deterministic, so it is built once per process and shared; the
+        shallow copy keeps callers from aliasing the cached object.
         """
-        rng = np.random.default_rng(seed=42)
-        start_date = date(2024, 8, 1)
-        end_date = start_date + timedelta(days=119)  # Covers Aug–Nov 2024 (demo months)
-        days = pd.date_range(start=start_date, end=end_date, freq="D")
-        departments = ["TV", "GAMING", "AUDIO"]
-        channels = ["online", "store"]
-
-        rows = []
-        for day in days:
-            weekday_factor = 1.1 if day.weekday() in (4, 5) else 0.95
-            promo_flag = str(day.weekday() in (4, 5))
-            discount_base = 0.18 if promo_flag == "True" else 0.0
-
-            for dept_idx, dept in enumerate(departments, start=1):
-                dept_factor = 1.0 + (dept_idx * 0.05)
-                for ch_idx, channel in enumerate(channels, start=1):
-                    channel_factor = 1.0 + (ch_idx * 0.03)
-                    base_sales = 42000 * dept_factor * channel_factor * weekday_factor
-                    # Add a small deterministic noise
-                    noise = rng.normal(loc=0.0, scale=1500.0)
-                    sales_value = max(18000.0, base_sales + noise)
-                    margin_pct = 0.26 - (discount_base * 0.4)
-                    margin_value = sales_value * margin_pct
-                    units = max(80.0, sales_value / 400.0)
-
-                    rows.append(
-                        {
-                            "date": day.date(),
-                            "channel": channel,
-                            "department": dept,
-                            "promo_flag": promo_flag,
-                            "discount_pct": round(discount_base * 100, 2),
-                            "sales_value": round(sales_value, 2),
-                            "margin_value": round(margin_value, 2),
-                            "units": round(units, 2),
-                        }
-                    )
-
-        df = pd.DataFrame(rows)
-        df["channel"] = df["channel"].str.lower()
-        df["department"] = df["department"].str.upper()
-        df["promo_flag"] = df["promo_flag"].astype(str)
-        return df
+        return _default_synthetic_frame().copy(deep=False)
+
+
+@lru_cache(maxsize=1)
+def _default_synthetic_frame() -> DataFrame:
+    """Construct the deterministic demo frame (memoized per process)."""
+    rng = np.random.default_rng(seed=42)
+    start_date = date(2024, 8, 1)
+    end_date = start_date + timedelta(days=119)  # Covers Aug–Nov 2024 (demo months)
+    days = pd.date_range(start=start_date, end=end_date, freq="D")
+    departments = np.array(["TV", "GAMING", "AUDIO"])
+    channels = np.array(["online", "store"])
+
+    # Broadcast the day/department/channel factor grid instead of
+    # appending one dict per row; ravel order (day, department, channel)
+    # and the single noise draw match the original loop exactly
+    n_days, n_depts, n_channels = len(days), len(departments), len(channels)
+    is_weekend = np.isin(days.weekday, (4, 5))
+    weekday_factor = np.where(is_weekend, 1.1, 0.95)
+    discount_base = np.where(is_weekend, 0.18, 0.0)
+    dept_factor = 1.0 + np.arange(1, n_depts + 1) * 0.05
+    channel_factor = 1.0 + np.arange(1, n_channels + 1) * 0.03
+
+    base_sales = (
+        42000
+        * weekday_factor[:, None, None]
+        * dept_factor[None, :, None]
+        * channel_factor[None, None, :]
+    )
+    # Add a small deterministic noise
+    noise = rng.normal(loc=0.0, scale=1500.0, size=base_sales.shape)
+    sales_value = np.maximum(18000.0, base_sales + noise)
+    margin_pct = (0.26 - discount_base * 0.4)[:, None, None]
+    margin_value = sales_value * margin_pct
+    units = np.maximum(80.0, sales_value / 400.0)
+
+    per_day = n_depts * n_channels
+    return pd.DataFrame(
+        {
+            "date": np.repeat(days.values, per_day),
+            "channel": pd.Categorical(np.tile(channels, n_days * n_depts)),
+            "department": pd.Categorical(np.tile(np.repeat(departments, n_channels), n_days)),
+            "promo_flag": pd.Categorical(np.repeat(np.where(is_weekend, "True", "False"), per_day)),
+            # float32 matches the CSV path: cents-level precision is
+            # plenty and the groupby sums stream half the bytes
+            "discount_pct": np.repeat(np.round(discount_base * 100, 2), per_day).astype("float32"),
+            "sales_value": np.round(sales_value.ravel(), 2).astype("float32"),
+            "margin_value": np.round(margin_value.ravel(), 2).astype("float32"),
+            "units": np.round(units.ravel(), 2).astype("float32"),
+        }
+    )
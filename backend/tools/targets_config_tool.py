@@ -22,6 +22,11 @@ class TargetsConfigTool:
         "2024-09": {"sales_target": 950000.0, "margin_target": 0.23, "ebit_target": 150000.0, "units_target": 1800},
     }
 
+    # Validate each month's Targets once at class creation; get_targets is
+    # then a dict lookup instead of a per-call constructor
+    _TARGETS_CACHE = {m: Targets(month=m, **v) for m, v in DEFAULT_TARGETS.items()}
+    _LATEST_TARGETS = _TARGETS_CACHE[max(DEFAULT_TARGETS)]
+
     DEFAULT_CONSTRAINTS = Constraints(
         max_discount=0.25,  # expressed as fraction
         min_margin=0.18,
@@ -59,12 +64,12 @@ class TargetsConfigTool:
         Returns:
             Targets object with sales, margin, EBIT targets
         """
-        target_values = self.DEFAULT_TARGETS.get(month)
-        if not target_values:
-            # Fall back to the latest known month values to keep the API usable
-            latest_month = sorted(self.DEFAULT_TARGETS.keys())[-1]
-            target_values = self.DEFAULT_TARGETS[latest_month]
-        return Targets(month=month, **target_values)
+        targets = self._TARGETS_CACHE.get(month)
+        if targets is not None:
+            return targets
+        # Fall back to the latest known month values to keep the API usable;
+        # model_copy rebinds the month without re-running validation
+        return self._LATEST_TARGETS.model_copy(update={"month": month})
     
     def get_promo_constraints(
         self
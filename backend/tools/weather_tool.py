@@ -4,8 +4,13 @@ Weather Tool for Context Engine
 Uses Open-Meteo API (free, no API key required) to fetch weather forecasts.
 """
 
+import numpy as np
+import orjson
+import pandas as pd
 import requests
-from typing import Dict, List, Optional
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, date, timedelta
 import logging
 
@@ -19,6 +24,14 @@ class WeatherTool:
     BASE_URL = "https://api.open-meteo.com/v1/forecast"
     
     # Geographic coordinates for major cities/regions
+    # WMO code → condition lookup table; indexing replaces the per-day
+    # if/elif chain and lets a whole forecast map in one NumPy take
+    _CODE_TABLE = np.array(["cloud"] * 100, dtype=object)
+    _CODE_TABLE[0] = "sun"  # Clear sky
+    _CODE_TABLE[[51, 53, 55, 56, 57, 61, 63, 65, 66, 67, 80, 81, 82]] = "rain"
+    _CODE_TABLE[[71, 73, 75, 77, 85, 86]] = "snow"
+    _CODE_TABLE[[95, 96, 99]] = "storm"
+
     GEO_COORDINATES = {
         "DE": {"latitude": 51.1657, "longitude": 10.4515, "name": "Germany"},
         "UA": {"latitude": 48.3794, "longitude": 31.1656, "name": "Ukraine"},
@@ -36,7 +49,30 @@ class WeatherTool:
             base_url: Optional custom API base URL (for testing)
         """
         self.base_url = base_url or self.BASE_URL
-    
+        # A shared Session keeps the TCP/TLS connection alive across calls
+        # instead of handshaking per request
+        self._session = requests.Session()
+        # Per-instance LRU so repeated (location, date range) queries are
+        # answered from memory without hitting the API again
+        self._fetch = lru_cache(maxsize=256)(self._fetch_json)
+
+    def _fetch_json(self, url: str, params: Tuple) -> Dict:
+        """Perform one GET and return the parsed JSON body.
+
+        Args:
+            url: Endpoint URL
+            params: Query parameters as a sorted tuple of (key, value)
+                pairs so the call is hashable for the cache
+
+        Returns:
+            Parsed JSON response
+        """
+        response = self._session.get(url, params=dict(params), timeout=10)
+        response.raise_for_status()
+        # orjson parses the float-heavy daily arrays several times faster
+        # than the stdlib decoder behind Response.json()
+        return orjson.loads(response.content)
+
     def get_weather_forecast(
         self,
         location: str,
@@ -88,23 +124,20 @@ class WeatherTool:
                 "longitude": coords["longitude"],
                 "start_date": start_str,
                 "end_date": end_str,
-                "daily": [
+                "daily": (
                     "temperature_2m_max",
                     "temperature_2m_min",
                     "precipitation_probability_max",
                     "precipitation_sum",
                     "weather_code",
                     "cloud_cover_max"
-                ],
+                ),
                 "timezone": timezone
             }
-            
-            # Make API request
+
+            # Make API request (cached per parameter set)
             logger.info(f"Fetching weather for {location} ({start_str} to {end_str})")
-            response = requests.get(self.base_url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self._fetch(self.base_url, tuple(sorted(params.items())))
             
             # Parse response
             daily_data = data.get("daily", {})
@@ -118,27 +151,39 @@ class WeatherTool:
             rain_sum = daily_data.get("precipitation_sum", [])
             cloud_cover = daily_data.get("cloud_cover_max", [])
             
-            # Build daily forecast list
-            daily_forecast = []
-            for i, date_str in enumerate(dates):
-                condition = self._weather_code_to_condition(
-                    weather_codes[i] if i < len(weather_codes) else 0
-                )
-                
-                daily_forecast.append({
-                    "date": date_str,
-                    "condition": condition,
-                    "temp_max": temp_max[i] if i < len(temp_max) else None,
-                    "temp_min": temp_min[i] if i < len(temp_min) else None,
-                    "temp_avg": (
-                        (temp_max[i] + temp_min[i]) / 2
-                        if i < len(temp_max) and i < len(temp_min)
-                        else None
-                    ),
-                    "rain_prob": rain_prob[i] if i < len(rain_prob) else 0,
-                    "rain_sum": rain_sum[i] if i < len(rain_sum) else 0,
-                    "cloud_cover": cloud_cover[i] if i < len(cloud_cover) else None
-                })
+            # Build the daily list from whole arrays instead of per-day dict
+            # construction: pad each series to the date axis (NaN for temps
+            # and cloud cover, 0 for rain, matching the old per-index
+            # fallbacks), map codes through the lookup table, and emit
+            # records in one pass
+            n = len(dates)
+
+            def _pad(values, fill):
+                arr = np.full(n, fill, dtype=float)
+                arr[:min(len(values), n)] = values[:n]
+                return arr
+
+            codes = np.zeros(n, dtype=int)
+            codes[:min(len(weather_codes), n)] = weather_codes[:n]
+            conditions = self._CODE_TABLE[np.clip(codes, 0, len(self._CODE_TABLE) - 1)]
+            # Codes beyond the response default to cloud, not clear sky
+            conditions[min(len(weather_codes), n):] = "cloud"
+
+            tmax = _pad(temp_max, np.nan)
+            tmin = _pad(temp_min, np.nan)
+            df_daily = pd.DataFrame({
+                "date": dates,
+                "condition": conditions,
+                "temp_max": tmax,
+                "temp_min": tmin,
+                "temp_avg": (tmax + tmin) / 2.0,
+                "rain_prob": _pad(rain_prob, 0),
+                "rain_sum": _pad(rain_sum, 0),
+                "cloud_cover": _pad(cloud_cover, np.nan)
+            })
+            # NaN padding becomes None so downstream "is not None" checks
+            # keep skipping missing values
+            daily_forecast = df_daily.astype(object).where(pd.notna(df_daily), None).to_dict('records')
             
             # Generate summary
             summary = self._generate_summary(daily_forecast)
@@ -196,27 +241,9 @@ class WeatherTool:
         Returns:
             Condition string: "sun", "cloud", "rain", "snow", "storm"
         """
-        # WMO Weather Code mapping
-        if code == 0:
-            return "sun"  # Clear sky
-        elif code in [1, 2, 3]:
-            return "cloud"  # Mainly clear, partly cloudy, overcast
-        elif code in [45, 48]:
-            return "cloud"  # Fog
-        elif code in [51, 53, 55, 56, 57]:
-            return "rain"  # Drizzle
-        elif code in [61, 63, 65, 66, 67]:
-            return "rain"  # Rain
-        elif code in [71, 73, 75, 77]:
-            return "snow"  # Snow
-        elif code in [80, 81, 82]:
-            return "rain"  # Rain showers
-        elif code in [85, 86]:
-            return "snow"  # Snow showers
-        elif code in [95, 96, 99]:
-            return "storm"  # Thunderstorm
-        else:
-            return "cloud"  # Default
+        if 0 <= code < len(self._CODE_TABLE):
+            return self._CODE_TABLE[code]
+        return "cloud"  # Default
     
     def _generate_summary(self, daily_forecast: List[Dict]) -> str:
         """
@@ -230,22 +257,20 @@ class WeatherTool:
         """
         if not daily_forecast:
             return "No weather data available"
-        
-        # Count conditions
-        conditions = [day["condition"] for day in daily_forecast]
-        condition_counts = {}
-        for cond in conditions:
-            condition_counts[cond] = condition_counts.get(cond, 0) + 1
-        
+
         # Find dominant condition
-        dominant = max(condition_counts.items(), key=lambda x: x[1])[0]
-        
-        # Calculate average temperature
-        temps = [day["temp_avg"] for day in daily_forecast if day["temp_avg"] is not None]
-        avg_temp = sum(temps) / len(temps) if temps else None
-        
+        condition_counts = Counter(day["condition"] for day in daily_forecast)
+        dominant = condition_counts.most_common(1)[0][0]
+
+        # Calculate average temperature (SIMD mean over one float array)
+        temps = np.fromiter(
+            (day["temp_avg"] for day in daily_forecast if day["temp_avg"] is not None),
+            dtype=np.float64
+        )
+        avg_temp = temps.mean() if temps.size else None
+
         # Check for rain
-        rainy_days = sum(1 for day in daily_forecast if day["rain_prob"] > 60)
+        rainy_days = int(np.sum(np.asarray([day["rain_prob"] for day in daily_forecast]) > 60))
         
         # Build summary
         summary_parts = []
@@ -296,18 +321,16 @@ class WeatherTool:
             "longitude": coords["longitude"],
             "start_date": date.strftime("%Y-%m-%d"),
             "end_date": date.strftime("%Y-%m-%d"),
-            "daily": [
+            "daily": (
                 "temperature_2m_max",
                 "temperature_2m_min",
                 "precipitation_sum",
                 "weather_code"
-            ]
+            )
         }
-        
+
         try:
-            response = requests.get(historical_url, params=params, timeout=10)
-            response.raise_for_status()
-            return response.json()
+            return self._fetch(historical_url, tuple(sorted(params.items())))
         except Exception as e:
             logger.error(f"Error fetching historical weather: {str(e)}")
             raise
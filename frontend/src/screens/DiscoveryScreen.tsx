@@ -43,14 +43,13 @@ export default function DiscoveryScreen() {
   })
 
   const gapChartData = useMemo(() => {
-    if (!baseline?.daily_projections) return []
-    const entries = Object.entries(baseline.daily_projections)
-    const totalDays = entries.length || 1
+    if (!baseline?.dates?.length) return []
+    const totalDays = baseline.dates.length
     const targetTotal = baseline.total_sales - (gaps?.sales_gap ?? 0)
     const targetPerDay = targetTotal / totalDays
-    return entries.map(([date, vals]) => ({
+    return baseline.dates.map((date: string, i: number) => ({
       date,
-      actual: vals.sales,
+      actual: baseline.sales[i],
       target: targetPerDay,
     }))
   }, [baseline, gaps])